@@ -32,6 +32,7 @@ def feature_house_income(df_merge):
     return df_merge
 
 # 치매가족여부
+# get_dementia_case: 행 단위 기준 규칙 (검증/벤치마크용, scripts/bench_features.py)
 def get_dementia_case(row):
     if row['fma_27z1'] == 1 and row['fma_26z1'] == 1:
         return 1 # 치매가족 있음 + 같이 거주
@@ -43,10 +44,17 @@ def get_dementia_case(row):
         return np.nan
 
 def feature_dementia_case(df_merge):
-    df_merge['fma_dementia_case'] = df_merge.apply(get_dementia_case, axis=1)
+    # get_dementia_case와 같은 규칙을 컬럼 단위로 처리 (결측 등 나머지는 NaN)
+    has_case = df_merge['fma_27z1'] == 1
+    df_merge['fma_dementia_case'] = np.select(
+        [has_case & (df_merge['fma_26z1'] == 1), has_case & (df_merge['fma_26z1'] == 2), df_merge['fma_27z1'] == 2],
+        [1, 2, 3],
+        default=np.nan,
+    )
     return df_merge
 
 # 일반담배일평균(단위: 개비)
 def feature_smoke_avg_per_day(df_merge):
-    df_merge['smoke_avg_per_day'] = df_merge.apply(lambda x : x[['smb_01z1', 'smb_03z1', 'smb_06z1']].max(skipna=True), axis=1)
+    # 세 컬럼 중 결측을 제외한 최댓값 (모두 결측이면 NaN)
+    df_merge['smoke_avg_per_day'] = df_merge[['smb_01z1', 'smb_03z1', 'smb_06z1']].max(axis=1, skipna=True)
     return df_merge
\ No newline at end of file
@@ -12,24 +12,45 @@ import numpy as np
 
 
 # 체중조절방법
+# 세 컬럼 응답을 4진수 한 자리씩 묶은 정수 코드 (0~63, int8)
+# 자리값: 0=무응답(NaN), 1=예, 2=아니오, 3=그 외 응답
+WEIGHT_CONTROL_COLS = ['obb_02a1', 'obb_02b1', 'obb_02d1']
+# ["체중조절방법_운동", "체중조절방법_단식", "체중조절방법_무처방약물"]
+WEIGHT_CONTROL_DIGITS = {0: "no_response", 1: "1", 2: "2", 3: "other"}
+
+def pack_weight_control(*digits):
+    """자리값(운동, 단식, 무처방약물 순) → 코드. 예: pack_weight_control(1, 2, 2) == 26"""
+    code = 0
+    for d in digits:
+        code = code * 4 + d
+    return code
+
+# 코드 → 표시용 문자열 (예: 26 → "1-2-2")
+WEIGHT_CONTROL_TABLE = {
+    pack_weight_control(a, b, d): "-".join(WEIGHT_CONTROL_DIGITS[x] for x in (a, b, d))
+    for a in range(4) for b in range(4) for d in range(4)
+}
+
+def decode_weight_control_method(codes):
+    """weight_control_method 코드 → 표시용 문자열 Series"""
+    return pd.Series(codes).map(WEIGHT_CONTROL_TABLE)
+
 def feature_weight_control_method(df_merge):
-    cols = ['obb_02a1', 'obb_02b1', 'obb_02d1']
-    # ["체중조절방법_운동", "체중조절방법_단식", "체중조절방법_무처방약물"]
-
-    # 세 컬럼 모두 NaN인 행의 개수
-    all_nan_count = df_merge[cols].isna().all(axis=1).sum()
-
-    # NaN을 '비응답'으로 대체하고, 세 칼럼을 조합한 문자열 생성
-    df_merge["weight_control_method"] = (
-        df_merge[cols]
-        .fillna("no_response")          # NaN → '비응답'
-        .astype(str)               # 숫자를 문자열로 변환
-        .agg("-".join, axis=1)     # 3개 값을 '-'로 연결
-    )
+    # 행마다 문자열을 join하지 않고 컬럼 단위로 자리값을 계산해 정수로 묶음
+    code = np.zeros(len(df_merge), dtype='int8')
+    for col in WEIGHT_CONTROL_COLS:
+        s = df_merge[col]
+        digit = np.select([s.isna(), s == 1, s == 2], [0, 1, 2], default=3).astype('int8')
+        code = code * 4 + digit
+    df_merge["weight_control_method"] = code
 
     return df_merge
 
 
+# 활동점수 구간: [0,1) 없음, [1,5) 적음, [5,10) 보통, 10 이상 많음 (smoke_churn_model/modules/features_pdy.py와 같은 정의)
+ACTIVITY_BINS = [-np.inf, 1, 5, 10, np.inf]
+ACTIVITY_LABELS = ["no_activity", "row_activity", "normal_activity", "high_activity"]
+
 # 가중치 곱한 활동점수, 그에 따른 범주화
 def feature_activity_score_and_weight(df_merge):
 
@@ -39,18 +60,10 @@ def feature_activity_score_and_weight(df_merge):
         1 * df_merge["phb_01z1"].fillna(0)
     )
     # 고강도, 중강도, 걷기 활동. 77 이상 NaN 처리되었다 가정
-    
-    def activity_level(x):
-        if x >= 10:
-            return "high_activity"
-        elif x >= 5:
-            return "normal_activity"
-        elif x >= 1:
-            return "row_activity"
-        else:
-            return "no_activity"
-
-    df_merge["activity_score"] = df_merge["activity_score_weight"].apply(activity_level)
+
+    df_merge["activity_score"] = pd.cut(
+        df_merge["activity_score_weight"], bins=ACTIVITY_BINS, labels=ACTIVITY_LABELS, right=False
+    )
 
     return df_merge
 
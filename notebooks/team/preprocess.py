@@ -12,6 +12,13 @@ from pathlib import Path
 current_path=os.getcwd()
 sys.path.append(os.path.abspath(os.path.join(os.path.join(current_path, 'notebooks/team'))))
 
+# 설문 CSV 공통 로더 / Parquet 캐시 (smoke_churn_model/modules/ingest.py, cache.py)
+_MODEL_DIR = str(Path(__file__).resolve().parents[2] / "smoke_churn_model")
+if _MODEL_DIR not in sys.path:
+    sys.path.append(_MODEL_DIR)
+from modules.ingest import read_survey
+from modules.cache import load_or_build, cache_path
+
 ROOT_DIR = Path("").resolve().parent.parent
 DATA_DIR = ROOT_DIR / "data"
 DATA_PATH = DATA_DIR / "raw_data.csv"
@@ -59,13 +66,14 @@ def rename_to_kor(df):
 # Data Cleaning
 # ==================================================
 from modules.features_pdy import Liquid_method2
-def make_target(data):
+def make_target(data, use_cache=True):
+    """use_cache: 경로 입력 시 원본을 Parquet 캐시에서 로드 (data/.cache, 원본 내용이 바뀌면 다시 파싱)"""
 
     # 과거 또는 현재 흡연자만 도출
     if isinstance(data, pd.DataFrame):
         anal_data = data[~((data['sma_03z2'] > 3.0) & (data['sma_12z2'] > 2.0) & (data['sma_37z1'] > 3.0))].reset_index(drop=True)
     else:
-        com_df = pd.read_csv(data)
+        com_df = load_or_build(data, "raw", lambda: read_survey(data)) if use_cache else read_survey(data)
         anal_data = com_df[~((com_df['sma_03z2'] > 3.0) & (com_df['sma_12z2'] > 2.0) & (com_df['sma_37z1'] > 3.0))].reset_index(drop=True)
 
     # 현재 흡연 여부. 하나라도 현재 피우고 있으면 흡연 중
@@ -100,7 +108,7 @@ def make_target(data):
 # ==================================================
 def preprocess_basic_house(data_path):
     cols = get_columns("기본정보", "가구조사")
-    df = pd.read_csv(data_path, usecols=cols)
+    df = read_survey(data_path, usecols=cols)
 
     # 'b' 문자 전처리
     if "exmprs_no" in df.columns:
@@ -135,7 +143,7 @@ def preprocess_basic_house(data_path):
 # ==================================================
 def preprocess_diet_obesity_oral(data_path):
     cols = get_columns("식생활", "비만및체중조절", "구강건강")
-    df = pd.read_csv(data_path, usecols=cols)
+    df = read_survey(data_path, usecols=cols)
 
     # 'b' 문자 전처리
     if "exmprs_no" in df.columns:
@@ -157,7 +165,7 @@ def preprocess_diet_obesity_oral(data_path):
 # ==================================================
 def preprocess_drink_physical(data_path):
     cols = get_columns("음주", "신체활동")
-    df = pd.read_csv(data_path, usecols=cols)
+    df = read_survey(data_path, usecols=cols)
 
     # 'b' 문자 전처리
     if "exmprs_no" in df.columns:
@@ -186,7 +194,7 @@ def preprocess_drink_physical(data_path):
 # ==================================================
 def preprocess_mental_health(data_path):
     cols = get_columns("정신건강", "보건이용")
-    df = pd.read_csv(data_path, usecols=cols)
+    df = read_survey(data_path, usecols=cols)
 
     # 'b' 문자 전처리
     if "exmprs_no" in df.columns:
@@ -208,7 +216,7 @@ def preprocess_mental_health(data_path):
 # ==================================================
 def preprocess_behavior_education(data_path):
     cols = get_columns("건강행태", "교육및경제활동")
-    df = pd.read_csv(data_path, usecols=cols)
+    df = read_survey(data_path, usecols=cols)
 
     # 'b' 문자 전처리
     if "exmprs_no" in df.columns:
@@ -229,7 +237,16 @@ def preprocess_behavior_education(data_path):
                 df.loc[df[col] >= 777, col] = np.nan
     return df
 
-def preprocessing_data(DATA_PATH):
+def preprocessing_data(DATA_PATH, use_cache=True):
+    """use_cache: 정제 결과를 Parquet 캐시에서 로드/저장 (원본 해시 + columns.json 기준)"""
+    if use_cache:
+        hit = cache_path(DATA_PATH, "team_prep", columns_dict).exists()
+        df_merge = load_or_build(
+            DATA_PATH, "team_prep", lambda: preprocessing_data(DATA_PATH, use_cache=False), columns_dict=columns_dict
+        )
+        if hit: # 새로 만든 경우는 preprocessing_data(use_cache=False)에서 이미 출력
+            print("(전처리)데이터 크기:", df_merge.shape, '(캐시)')
+        return df_merge
 
     df_basic = preprocess_basic_house(DATA_PATH)
     df_health = preprocess_diet_obesity_oral(DATA_PATH)
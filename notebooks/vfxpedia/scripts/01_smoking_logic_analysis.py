@@ -11,10 +11,18 @@
 작성일: 2025-10-12
 """
 
+import sys
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+from pathlib import Path
+
+# 설문 CSV 공통 로더 (smoke_churn_model/modules/ingest.py)
+_MODEL_DIR = str(Path(__file__).resolve().parents[3] / "smoke_churn_model")
+if _MODEL_DIR not in sys.path:
+    sys.path.append(_MODEL_DIR)
+from modules.ingest import read_survey
 
 # 한글 폰트 설정
 plt.rcParams['font.family'] = 'Malgun Gothic'
@@ -26,7 +34,7 @@ plt.rcParams['axes.unicode_minus'] = False
 def load_data():
     """데이터 로딩"""
     data_path = '../../../data/analy_data.csv'
-    df = pd.read_csv(data_path)
+    df = read_survey(data_path)
     print(f"✅ 데이터 로딩 완료: {df.shape}")
     return df
 
@@ -5,8 +5,16 @@
 작성: 2025-10-07
 """
 
+import sys
 import pandas as pd
 import numpy as np
+from pathlib import Path
+
+# 설문 CSV 공통 로더 (smoke_churn_model/modules/ingest.py)
+_MODEL_DIR = str(Path(__file__).resolve().parents[3] / "smoke_churn_model")
+if _MODEL_DIR not in sys.path:
+    sys.path.append(_MODEL_DIR)
+from modules.ingest import read_survey
 
 
 # ============================================================================
@@ -109,7 +117,7 @@ def add_economic_status_features(df, verbose=True):
     
     Example:
     --------
-    >>> df = pd.read_csv('analy_data.csv')
+    >>> df = read_survey('analy_data.csv')
     >>> df = add_economic_status_features(df)
     >>> 
     >>> # 이제 명확하게 사용 가능:
@@ -234,7 +242,7 @@ def clean_data_for_analysis(input_path, output_path=None, verbose=True):
     """
     
     # 데이터 로드
-    df = pd.read_csv(input_path)
+    df = read_survey(input_path)
     df_original = df.copy()
     df_clean = df.copy()
     
@@ -0,0 +1,151 @@
+"""
+Benchmark derived-feature functions against their row-wise reference rules.
+
+Usage (from repo root):
+  python scripts/bench_features.py [--rows 1000000] [--only dementia_case]
+
+Each benchmark builds a synthetic frame with the columns the feature reads,
+runs the row-wise reference (DataFrame.apply) and the vectorized feature,
+checks that both produce the same column and prints the timings.
+Add new cases to BENCHMARKS.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "smoke_churn_model"))
+
+from modules import features_ksh, features_pdy  # noqa: E402
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - start
+
+
+def make_dementia_frame(rows: int, rng: np.random.Generator) -> pd.DataFrame:
+    # fma_27z1 / fma_26z1: 1, 2, 응답거부(7)/모름(9), 결측
+    values = np.array([1, 2, 7, 9, np.nan])
+    return pd.DataFrame({
+        "fma_27z1": rng.choice(values, rows, p=[0.1, 0.8, 0.03, 0.02, 0.05]),
+        "fma_26z1": rng.choice(values, rows, p=[0.05, 0.1, 0.01, 0.01, 0.83]),
+    })
+
+
+def bench_dementia_case(rows: int, rng: np.random.Generator) -> dict:
+    df = make_dementia_frame(rows, rng)
+    ref, t_ref = _timed(lambda d: d.apply(features_ksh.get_dementia_case, axis=1), df)
+    out, t_vec = _timed(features_ksh.feature_dementia_case, df.copy())
+    pd.testing.assert_series_equal(
+        out["fma_dementia_case"], ref.astype("float64"), check_names=False
+    )
+    return {"reference": t_ref, "vectorized": t_vec}
+
+
+def make_smoke_frame(rows: int, rng: np.random.Generator) -> pd.DataFrame:
+    # smb_01z1 / smb_03z1 / smb_06z1: 하루 개비 수, 비해당은 결측
+    frame = {}
+    for col in ("smb_01z1", "smb_03z1", "smb_06z1"):
+        values = rng.integers(0, 40, rows).astype("float64")
+        values[rng.random(rows) < 0.6] = np.nan
+        frame[col] = values
+    frame["age"] = rng.integers(19, 90, rows)  # 기존 apply처럼 다른 컬럼이 섞인 행에서 꺼내도록
+    return pd.DataFrame(frame)
+
+
+def bench_smoke_avg_per_day(rows: int, rng: np.random.Generator) -> dict:
+    df = make_smoke_frame(rows, rng)
+    cols = ["smb_01z1", "smb_03z1", "smb_06z1"]
+    ref, t_ref = _timed(lambda d: d.apply(lambda x: x[cols].max(skipna=True), axis=1), df)
+    out, t_vec = _timed(features_ksh.feature_smoke_avg_per_day, df.copy())
+    pd.testing.assert_series_equal(
+        out["smoke_avg_per_day"], ref.astype("float64"), check_names=False
+    )
+    return {"reference": t_ref, "vectorized": t_vec}
+
+
+def make_weight_control_frame(rows: int, rng: np.random.Generator) -> pd.DataFrame:
+    # obb_02a1 / obb_02b1 / obb_02d1: 1=예, 2=아니오, 그 외 코드, 결측
+    values = np.array([1, 2, 8, np.nan])
+    return pd.DataFrame({
+        col: rng.choice(values, rows, p=[0.3, 0.2, 0.02, 0.48])
+        for col in features_pdy.WEIGHT_CONTROL_COLS
+    })
+
+
+def bench_weight_control_method(rows: int, rng: np.random.Generator) -> dict:
+    df = make_weight_control_frame(rows, rng)
+    cols = features_pdy.WEIGHT_CONTROL_COLS
+    # 기존 방식: 행마다 문자열 join (예: "1.0-2.0-no_response")
+    ref, t_ref = _timed(lambda d: d[cols].fillna("no_response").astype(str).agg("-".join, axis=1), df)
+    out, t_vec = _timed(features_pdy.feature_weight_control_method, df.copy())
+    labels = {"no_response": "no_response", "1.0": "1", "2.0": "2"}
+    expected = ref.map(lambda s: "-".join(labels.get(x, "other") for x in s.split("-")))
+    decoded = features_pdy.decode_weight_control_method(out["weight_control_method"])
+    pd.testing.assert_series_equal(decoded, expected, check_names=False)
+    return {"reference": t_ref, "vectorized": t_vec}
+
+
+def make_activity_frame(rows: int, rng: np.random.Generator) -> pd.DataFrame:
+    # pha_04z1 / pha_06z1 / phb_01z1: 주당 활동 일수 (0~7), 결측 포함
+    frame = {}
+    for col in ("pha_04z1", "pha_06z1", "phb_01z1"):
+        values = rng.integers(0, 8, rows).astype("float64")
+        values[rng.random(rows) < 0.1] = np.nan
+        frame[col] = values
+    return pd.DataFrame(frame)
+
+
+def _activity_level(x):
+    # 기존 행 단위 구간 규칙
+    if x >= 10:
+        return "high_activity"
+    elif x >= 5:
+        return "normal_activity"
+    elif x >= 1:
+        return "row_activity"
+    else:
+        return "no_activity"
+
+
+def bench_activity_score(rows: int, rng: np.random.Generator) -> dict:
+    df = make_activity_frame(rows, rng)
+    out, t_vec = _timed(features_pdy.feature_activity_score_and_weight, df.copy())
+    ref, t_ref = _timed(lambda s: s.apply(_activity_level), out["activity_score_weight"])
+    pd.testing.assert_series_equal(out["activity_score"].astype(object), ref, check_names=False)
+    return {"reference": t_ref, "vectorized": t_vec}
+
+
+BENCHMARKS = {
+    "dementia_case": bench_dementia_case,
+    "smoke_avg_per_day": bench_smoke_avg_per_day,
+    "weight_control_method": bench_weight_control_method,
+    "activity_score": bench_activity_score,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--only", choices=sorted(BENCHMARKS), action="append")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    for name in args.only or BENCHMARKS:
+        timings = BENCHMARKS[name](args.rows, rng)
+        ref, vec = timings["reference"], timings["vectorized"]
+        print(f"{name:<22} rows={args.rows:,}  reference={ref:8.3f}s  vectorized={vec:8.3f}s  x{ref / vec:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Measure peak memory (RSS) of features_sangmin.apply_my_features.
+
+Usage (from repo root):
+  python scripts/bench_memory.py [--rows 200000] [--cols 120]
+
+Each mode runs in a fresh subprocess so the peak RSS (ru_maxrss) of one run
+does not hide the next. The frame is built as a single float64 block, so
+building it does not raise the peak above one frame. For each mode the
+script prints the frame size and how far RSS peaked above the level before
+apply_my_features was called. Linux only (/proc/self/statm).
+
+Modes:
+- reference: the old copy-per-step apply_my_features, loaded with `git show`
+             from --reference-rev (default: the baseline commit)
+- copy:      apply_my_features(df)               → the result is a new frame
+- inplace:   apply_my_features(df, copy=False)   → derived columns are added to df
+
+The copy and inplace lines also print their peak relative to the reference.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import resource
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "smoke_churn_model"))
+
+from modules import features_sangmin  # noqa: E402
+
+MODES = {"reference": True, "copy": True, "inplace": False}
+
+# Commit holding the old copy-per-step implementation (every step called df.copy())
+REFERENCE_REV = "0a45973"
+SANGMIN_PATH = "smoke_churn_model/modules/features_sangmin.py"
+
+# apply_my_features가 읽는 원본 컬럼 (응답 코드 1~5, 결측 포함)
+SANGMIN_INPUTS = [
+    "nua_01z2", "nuc_02z1", "nuc_01z2", "nuc_03z1", "oba_02z1", "oba_bmi", "oba_01z1", "obb_01z1",
+    "obb_02a1", "obb_02b1", "obb_02c1", "obb_02d1", "obb_02e1", "obb_02f1", "obb_02g1", "obb_02h1", "obb_02i1",
+    "ore_03z2", "ord_01d2", "ord_01f3", "ord_05z1", "ora_01z1", "orb_01z1",
+]
+
+MB = 1024 * 1024
+
+
+def _current_rss() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _peak_rss() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024  # Linux: KB
+
+
+def load_reference(rev: str) -> types.ModuleType:
+    """Load features_sangmin.py as it was at `rev` without touching the working tree."""
+    source = subprocess.run(
+        ["git", "-C", str(REPO_ROOT), "show", f"{rev}:{SANGMIN_PATH}"],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    module = types.ModuleType("features_sangmin_reference")
+    exec(compile(source, f"{rev}:{SANGMIN_PATH}", "exec"), module.__dict__)
+    return module
+
+
+def make_frame(rows: int, cols: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    names = SANGMIN_INPUTS + [f"col_{i:03d}" for i in range(max(cols - len(SANGMIN_INPUTS), 0))]
+    values = np.empty((rows, len(names)), dtype="float64")
+    for j in range(len(names)):
+        values[:, j] = rng.integers(1, 6, rows)
+        values[rng.random(rows) < 0.2, j] = np.nan
+    values[:, names.index("oba_02z1")] *= 35  # 신장(cm) 범위로
+    values[:, names.index("oba_bmi")] *= 6    # BMI 범위로
+    return pd.DataFrame(values, columns=names, copy=False)
+
+
+def worker(mode: str, rows: int, cols: int, seed: int, reference_rev: str) -> dict:
+    module = load_reference(reference_rev) if mode == "reference" else features_sangmin
+    df = make_frame(rows, cols, seed)
+    frame_mb = df.memory_usage(index=False).sum() / MB
+    gc.collect()
+    before = _current_rss()
+    out = module.apply_my_features(df, copy=MODES[mode])
+    peak = _peak_rss()
+    return {
+        "mode": mode,
+        "frame_mb": frame_mb,
+        "peak_over_start_mb": (peak - before) / MB,
+        "new_cols": len(out.columns) - cols,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--cols", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--reference-rev", default=REFERENCE_REV,
+                        help=f"git revision with the old implementation (default: {REFERENCE_REV})")
+    parser.add_argument("--worker", choices=sorted(MODES), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(worker(args.worker, args.rows, args.cols, args.seed, args.reference_rev)))
+        return
+
+    reference_peak = None
+    for mode in MODES:
+        cmd = [sys.executable, __file__, "--worker", mode, "--reference-rev", args.reference_rev,
+               "--rows", str(args.rows), "--cols", str(args.cols), "--seed", str(args.seed)]
+        result = json.loads(subprocess.run(cmd, check=True, capture_output=True, text=True).stdout)
+        peak = result["peak_over_start_mb"]
+        if mode == "reference":
+            reference_peak = peak
+            vs_reference = ""
+        else:
+            vs_reference = f"  ({peak / reference_peak:.0%} of reference)"
+        print(f"{mode:<9} rows={args.rows:,} cols={args.cols}  frame={result['frame_mb']:7.1f}MB  "
+              f"peak over start={peak:7.1f}MB  "
+              f"(x{peak / result['frame_mb']:.1f} frame)  new cols={result['new_cols']}{vs_reference}")
+
+
+if __name__ == "__main__":
+    main()
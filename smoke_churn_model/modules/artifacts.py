@@ -0,0 +1,63 @@
+# ==================================================
+# 내용: 학습/평가 결과 파일 저장·로드 (Parquet)
+# CSV(utf-8-sig) 대신 타입이 유지되는 Parquet으로 저장, 저장은 백그라운드 스레드에서 수행
+# 로드는 Parquet 우선, 없으면 기존 CSV로 대체 (이전 결과 파일 호환)
+# 다른 모듈(config 등)에 의존하지 않으므로 노트북/Streamlit에서도 그대로 import 가능
+# ==================================================
+import atexit
+import pandas as pd
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# 결과 파일 저장 전용 스레드 (1개 → 저장 순서 보장)
+_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifact-writer")
+_pending = []
+
+# 범주형 결측 표시용 문자열 (catboost 입력용 인코딩) → 저장 시 NaN으로 복원
+MISSING_TOKEN = "missing"
+
+def _typed(df):
+    """
+    object 컬럼: 'missing' → NaN, 나머지 값은 문자열로 통일 (Parquet은 한 컬럼에 타입이 섞이면 저장 불가)
+    숫자처럼 보이는 범주형 코드도 수치형으로 바꾸지 않음 → 저장 전과 같은 문자열로 로드됨
+    """
+    for col in df.columns[df.dtypes == object]:
+        s = df[col].mask(df[col] == MISSING_TOKEN)
+        df[col] = s.where(s.isna(), s.astype(str))
+    return df
+
+def _write_parquet(df, path):
+    df = _typed(df)
+    tmp = path.with_suffix(".tmp")
+    df.to_parquet(tmp, index=False)
+    tmp.replace(path)
+    return path
+
+def save_table(df, path):
+    """
+    DataFrame을 Parquet으로 저장 (백그라운드 스레드, Future 반환)
+    - path: 저장 경로 (.csv로 넘겨도 같은 이름의 .parquet으로 저장)
+    - 'missing' 문자열은 NaN으로 되돌리고 object 컬럼 타입 정리 (저장 스레드에서 처리)
+    - 호출 시점의 데이터를 복사해서 넘기므로 이후 df를 수정해도 안전
+    """
+    path = Path(path).with_suffix(".parquet")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    future = _writer.submit(_write_parquet, df.copy(), path)
+    _pending.append(future)
+    return future
+
+def wait_pending():
+    """진행 중인 저장 작업 완료 대기 (실패 시 예외 전달)"""
+    while _pending:
+        _pending.pop(0).result()
+
+# 인터프리터 종료 전에 남은 저장 마무리
+atexit.register(wait_pending)
+
+def load_table(path):
+    """결과 파일 로드: 같은 이름의 .parquet이 있으면 Parquet, 없으면 CSV"""
+    path = Path(path)
+    parquet_path = path.with_suffix(".parquet")
+    if parquet_path.exists():
+        return pd.read_parquet(parquet_path)
+    return pd.read_csv(path.with_suffix(".csv"))
@@ -0,0 +1,202 @@
+# ==================================================
+# 내용: 원본/정제 설문 데이터 컬럼형 캐시 (Parquet)
+# 캐시 키: 원본 파일 내용 해시 + columns.json 메타(use 플래그 포함) + ID 인코딩 방식(ids.ID_ENCODING)
+# → raw_data.csv 교체 또는 columns.json 수정 시 자동 무효화
+# 피처 캐시: 피처 함수별 출력 컬럼 (키: 입력 컬럼 지문 + 함수 소스 지문)
+# ==================================================
+import os
+import json
+import types
+import tempfile
+import hashlib
+import inspect
+import pandas as pd
+from pathlib import Path
+
+from modules.config import DATA_DIR
+from modules.ids import ID_ENCODING
+
+CACHE_DIR = DATA_DIR / ".cache"
+FEATURE_CACHE_DIR = CACHE_DIR / "features"
+
+# (경로, 크기, 수정시각) → 내용 해시. 같은 프로세스 안에서 재해시 방지
+_digest_memo = {}
+
+def file_digest(path, chunk_size=1 << 20):
+    """파일 내용 sha256 (대용량 파일은 청크 단위로 읽음)"""
+    stat = path.stat()
+    memo_key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+    if memo_key not in _digest_memo:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(chunk_size), b""):
+                h.update(block)
+        _digest_memo[memo_key] = h.hexdigest()
+    return _digest_memo[memo_key]
+
+def catalog_digest(columns_dict):
+    """columns.json 내용 해시 (키 순서와 무관)"""
+    text = json.dumps(columns_dict, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def source_key(data_path):
+    """원본 파일 위치 식별자 → 같은 tag라도 원본 파일(연도별 원본, 압축본 등)마다 캐시를 따로 유지"""
+    return hashlib.sha256(str(Path(data_path).resolve()).encode()).hexdigest()[:8]
+
+def cache_path(data_path, tag, columns_dict=None):
+    """캐시 파일 경로: {tag}-{원본위치}-{원본해시+카탈로그해시+ID 인코딩}.parquet"""
+    h = hashlib.sha256(file_digest(Path(data_path)).encode())
+    h.update(ID_ENCODING.encode()) # 캐시에 저장된 exmprs_no 대리키가 현재 인코딩과 같도록
+    if columns_dict is not None:
+        h.update(catalog_digest(columns_dict).encode())
+    return CACHE_DIR / f"{tag}-{source_key(data_path)}-{h.hexdigest()[:20]}.parquet"
+
+def _parquet_available():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+def _tmp_path(path):
+    """path와 같은 폴더의 고유 임시 파일 (여러 커널이 같은 캐시를 동시에 만들어도 서로 덮어쓰지 않음)"""
+    fd, name = tempfile.mkstemp(dir=path.parent, prefix=path.stem + "-", suffix=".tmp")
+    os.close(fd)
+    return Path(name)
+
+def load_or_build(data_path, tag, build, columns_dict=None):
+    """
+    캐시가 있으면 Parquet에서 로드, 없으면 build()로 생성 후 저장
+    - data_path: 캐시 키의 기준이 되는 원본 파일
+    - tag: 캐시 종류 (예: raw, prep_index)
+    - build: 캐시가 없을 때 DataFrame(또는 DataFrame 청크 이터레이터)을 만드는 함수
+      청크 이터레이터면 전체를 메모리에 모으지 않고 청크 단위로 Parquet에 이어씀
+    - columns_dict: 결과에 영향을 주는 컬럼 카탈로그 (없으면 원본 해시만 사용)
+    pyarrow가 없으면 캐시 없이 build() 결과를 그대로 반환
+    """
+    if not _parquet_available():
+        df = build()
+        return df if isinstance(df, pd.DataFrame) else pd.concat(df, ignore_index=True)
+
+    path = cache_path(data_path, tag, columns_dict)
+    if path.exists():
+        return pd.read_parquet(path)
+
+    df = build()
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+    # 같은 원본 파일·같은 tag의 이전 캐시(원본 내용 변경 전)만 정리, 다른 원본의 캐시는 유지
+    # 다른 커널이 먼저 지웠거나 방금 같은 캐시를 만든 경우도 있으므로 없는 파일은 무시
+    for old in CACHE_DIR.glob(f"{tag}-{source_key(data_path)}-*.parquet"):
+        if old != path:
+            old.unlink(missing_ok=True)
+
+    tmp = _tmp_path(path)
+    try:
+        if isinstance(df, pd.DataFrame):
+            df.to_parquet(tmp)
+        else:
+            _write_chunks(df, tmp)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    tmp.replace(path)
+    return df if isinstance(df, pd.DataFrame) else pd.read_parquet(path)
+
+def _write_chunks(chunks, path):
+    """DataFrame 청크들을 하나의 Parquet 파일로 이어쓰기 (스키마는 첫 청크 기준, 전부 결측인 컬럼은 문자열)"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer, schema = None, None
+    try:
+        for chunk in chunks:
+            if writer is None:
+                schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+                schema = pa.schema([
+                    field.with_type(pa.string()) if pa.types.is_null(field.type) else field for field in schema
+                ], metadata=schema.metadata)
+                writer = pq.ParquetWriter(path, schema)
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+    finally:
+        if writer is not None:
+            writer.close()
+
+def clear_cache(tag=None):
+    """캐시 삭제 (tag 미지정 시 전체, 피처 캐시 포함)"""
+    if not CACHE_DIR.exists():
+        return
+    pattern = f"{tag}-*.parquet" if tag else "*.parquet"
+    paths = CACHE_DIR.glob(pattern) if tag else CACHE_DIR.rglob(pattern)
+    for path in paths:
+        path.unlink(missing_ok=True)
+
+# ==================================================
+# 피처 캐시: 입력 컬럼과 피처 함수 소스가 같으면 저장된 출력 컬럼 재사용
+# ==================================================
+def columns_digest(df, columns):
+    """입력 컬럼 지문: 행 인덱스 + 컬럼별 (이름, dtype, 값 해시)"""
+    h = hashlib.sha256()
+    h.update(pd.util.hash_pandas_object(df.index).to_numpy().tobytes())
+    for col in columns:
+        h.update(f"{col}:{df[col].dtype}".encode())
+        h.update(pd.util.hash_pandas_object(df[col], index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+def _global_names(code):
+    """함수(중첩 함수/람다 포함)가 참조하는 전역 이름"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _global_names(const)
+    return names
+
+def source_digest(func):
+    """
+    피처 함수 소스 지문
+    같은 모듈에서 참조하는 헬퍼 함수 소스와 모듈 상수(매핑 dict, 구간 list 등) 값도 포함
+    → 다른 피처 함수를 수정해도 이 함수의 지문은 바뀌지 않음
+    """
+    h = hashlib.sha256()
+    seen, stack = set(), [func]
+    while stack:
+        f = stack.pop()
+        if f.__name__ in seen:
+            continue
+        seen.add(f.__name__)
+        h.update(inspect.getsource(f).encode())
+        for name in sorted(_global_names(f.__code__)):
+            value = f.__globals__.get(name)
+            if inspect.isfunction(value) and value.__module__ == func.__module__:
+                stack.append(value)
+            elif isinstance(value, (bool, int, float, str, list, tuple, dict)):
+                h.update(f"{name}={value!r}".encode())
+    return h.hexdigest()
+
+def feature_cache_path(name, key):
+    """피처 캐시 파일 경로: features/{피처이름}-{키}.parquet"""
+    return FEATURE_CACHE_DIR / f"{name}-{key[:20]}.parquet"
+
+def load_feature_cache(name, key):
+    """저장된 피처 출력 컬럼 (없으면 None)"""
+    path = feature_cache_path(name, key)
+    if not _parquet_available() or not path.exists():
+        return None
+    return pd.read_parquet(path)
+
+def save_feature_cache(name, key, df_out):
+    """피처 출력 컬럼 저장 (같은 피처의 이전 캐시는 정리, Parquet로 못 쓰는 컬럼이면 저장 생략)"""
+    if not _parquet_available():
+        return
+    FEATURE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = feature_cache_path(name, key)
+    tmp = _tmp_path(path)
+    try:
+        df_out.to_parquet(tmp, index=False)
+    except (ValueError, TypeError):
+        tmp.unlink(missing_ok=True)
+        return
+    for old in FEATURE_CACHE_DIR.glob(f"{name}-*.parquet"):
+        if old != path:
+            old.unlink(missing_ok=True)
+    tmp.replace(path)
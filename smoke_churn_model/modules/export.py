@@ -0,0 +1,89 @@
+# ==================================================
+# 내용: 학습용 피처 행렬 내보내기 (drop_feature 이후 단계)
+# X.npy(연속 메모리, 단일 dtype) + y.npy + ids.npy + manifest.json
+# → 학습/평가 코드에서 np.load(mmap_mode='r')로 여러 프로세스가 복사 없이 공유
+# ==================================================
+import json
+import numpy as np
+import pandas as pd
+
+from modules.config import DATA_DIR
+
+EXPORT_DIR = DATA_DIR / "matrix"
+MANIFEST_FILE = "manifest.json"
+
+def _encode_column(s):
+    """컬럼 → (수치 배열, 범주 목록 | None). 범주/문자열은 코드로, 결측은 NaN"""
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        codes = s.cat.codes.to_numpy()
+        return np.where(codes < 0, np.nan, codes), {"values": s.cat.categories.tolist(), "ordered": bool(s.cat.ordered)}
+    if s.dtype == object or isinstance(s.dtype, pd.StringDtype):
+        codes, uniques = pd.factorize(s)
+        return np.where(codes < 0, np.nan, codes), {"values": uniques.tolist(), "ordered": False}
+    return s.to_numpy(dtype="float64", na_value=np.nan), None
+
+def export_matrix(df, out_dir=EXPORT_DIR, target="churn", id_col="exmprs_no", dtype="float32"):
+    """
+    df: drop_feature 결과
+    target/id_col: 행렬에서 분리해 y.npy / ids.npy로 저장
+    dtype: 피처 행렬 dtype (기본 float32, 결측은 NaN)
+    반환: manifest dict
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    feature_cols = [c for c in df.columns if c not in (target, id_col)]
+
+    # 전체 DataFrame 복사본을 만들지 않고 memmap에 컬럼 단위로 채움
+    X = np.lib.format.open_memmap(out_dir / "X.npy", mode="w+", dtype=dtype, shape=(len(df), len(feature_cols)))
+    categories = {}
+    for j, col in enumerate(feature_cols):
+        values, cats = _encode_column(df[col])
+        X[:, j] = values
+        if cats is not None:
+            categories[col] = cats
+    X.flush()
+    del X
+
+    files = {"X": "X.npy"}
+    if target in df.columns:
+        np.save(out_dir / "y.npy", df[target].to_numpy())
+        files["y"] = "y.npy"
+    if id_col in df.columns:
+        np.save(out_dir / "ids.npy", df[id_col].to_numpy())
+        files["ids"] = "ids.npy"
+
+    manifest = {
+        "shape": [len(df), len(feature_cols)],
+        "dtype": dtype,
+        "columns": feature_cols,
+        "categories": categories,
+        "target": target,
+        "id_col": id_col,
+        "files": files,
+    }
+    with open(out_dir / MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    print("(내보내기)피처 행렬:", tuple(manifest["shape"]), dtype, "→", out_dir)
+    return manifest
+
+def load_matrix(out_dir=EXPORT_DIR, mmap_mode="r"):
+    """
+    export_matrix 결과 로드 (기본 읽기 전용 memmap → 프로세스 간 복사 없이 공유)
+    반환: X, y(없으면 None), ids(없으면 None), manifest
+    """
+    with open(out_dir / MANIFEST_FILE, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    files = manifest["files"]
+    X = np.load(out_dir / files["X"], mmap_mode=mmap_mode)
+    y = np.load(out_dir / files["y"], mmap_mode=mmap_mode) if "y" in files else None
+    ids = np.load(out_dir / files["ids"], mmap_mode=mmap_mode) if "ids" in files else None
+    return X, y, ids, manifest
+
+def to_frame(X, manifest):
+    """행렬 → DataFrame (범주 컬럼은 manifest의 범주 목록으로 category 복원, 분석/표시용)"""
+    df = pd.DataFrame(X, columns=manifest["columns"], copy=False)
+    for col, cats in manifest["categories"].items():
+        codes = df[col].fillna(-1).astype("int64")
+        df[col] = pd.Categorical.from_codes(codes, categories=cats["values"], ordered=cats["ordered"])
+    return df
@@ -6,9 +6,6 @@ import numpy as np
 # -----------------------------------
 _BIN_YN = {1: 1, 2: 0}  # 예/아니오 → 1/0
 
-def _as_copy(df, copy=True):
-    return df.copy() if copy else df
-
 def _safe_num(s):
     return pd.to_numeric(s, errors="coerce")
 
@@ -18,27 +15,49 @@ def _fill_mode(s):
     except Exception:
         return s.fillna(s.dropna().iloc[0] if s.dropna().size else s)
 
+def _fill_stat(s, name, how, stats=None):
+    """
+    결측치를 데이터셋 통계(median / 최빈값)로 대체
+    stats(dict)가 주어지면 저장된 값을 재사용하고, 없는 값은 계산해서 기록 (증분 처리용)
+    """
+    if stats is None:
+        return s.fillna(s.median()) if how == "median" else _fill_mode(s)
+
+    if name not in stats:
+        if how == "median":
+            value = s.median()
+        else:
+            mode = s.mode()
+            value = mode.iloc[0] if len(mode) else np.nan
+        stats[name] = None if pd.isna(value) else float(value)
+
+    return s if stats[name] is None else s.fillna(stats[name])
+
 def _ordered_cat(series, labels, add_unknown=True):
     cats = labels + (["Unknown"] if add_unknown and "Unknown" not in labels else [])
     s = series.astype("object").where(series.notna(), "Unknown")
     return pd.Categorical(s, categories=cats, ordered=True)
 
+# -----------------------------------
+# 각 단계는 df를 수정/복사하지 않고 새로 만든(또는 대체할) 컬럼만 dict로 반환
+# → apply_my_features에서 한 번에 붙임
+# -----------------------------------
+
 # -----------------------------------
 # 1) 식생활
 # -----------------------------------
-def _feature_diet(df):
-    df = df.copy()
+def _diet_columns(df, stats=None):
+    new = {}
 
     # 아침식사빈도 (1=주5~7회, 4=거의안함)
     if "nua_01z2" in df.columns:
         map_lbl = {1: "주5~7회", 2: "주3~4회", 3: "주1~2회", 4: "거의안함"}
-        df["breakfast_freq_cat"] = df["nua_01z2"].map(map_lbl)
-        df["breakfast_freq_cat"] = _ordered_cat(
-            df["breakfast_freq_cat"], ["주5~7회", "주3~4회", "주1~2회", "거의안함"]
+        new["breakfast_freq_cat"] = _ordered_cat(
+            df["nua_01z2"].map(map_lbl), ["주5~7회", "주3~4회", "주1~2회", "거의안함"]
         )
         # 점수(높을수록 바람직): 주5~7회=3 … 거의안함=0
-        df["breakfast_freq_score"] = df["nua_01z2"].replace({1: 3, 2: 2, 3: 1, 4: 0})
-        df["breakfast_freq_score"] = df["breakfast_freq_score"].fillna(df["breakfast_freq_score"].median())
+        score = df["nua_01z2"].replace({1: 3, 2: 2, 3: 1, 4: 0})
+        new["breakfast_freq_score"] = _fill_stat(score, "breakfast_freq_score", "median", stats)
 
     # 영양표시 인지/활용/관심 (1/2 → 1/0)
     for raw, out in {
@@ -47,53 +66,49 @@ def _feature_diet(df):
         "nuc_03z1": "nutrition_interest_bin",
     }.items():
         if raw in df.columns:
-            df[out] = df[raw].map(_BIN_YN)
-            df[out] = _fill_mode(df[out])
+            new[out] = _fill_stat(df[raw].map(_BIN_YN), out, "mode", stats)
 
-    return df
+    return new
 
 # -----------------------------------
 # 2) 비만·체중조절
 # -----------------------------------
-def _feature_obesity_weight(df, weight_col: str | None = None):
+def _obesity_weight_columns(df, weight_col: str | None = None, stats=None):
     """
     weight_col: BMI가 없고 체중이 따로 있을 때 체중 컬럼명 (예: 'oba_03z1' or 'weight_kg')
     """
-    df = df.copy()
+    new = {}
 
     # 신장(cm) → m
     if "oba_02z1" in df.columns:
-        df["height_m"] = _safe_num(df["oba_02z1"]) / 100
+        new["height_m"] = _safe_num(df["oba_02z1"]) / 100
+    height_m = new["height_m"] if "height_m" in new else df.get("height_m")
 
     # BMI (있으면 median 대체, 없고 키/체중 있으면 계산)
     if "oba_bmi" in df.columns:
-        df["oba_bmi"] = _safe_num(df["oba_bmi"])
-        df["oba_bmi"] = df["oba_bmi"].fillna(df["oba_bmi"].median())
+        new["oba_bmi"] = _fill_stat(_safe_num(df["oba_bmi"]), "oba_bmi", "median", stats)
     else:
-        if weight_col and weight_col in df.columns and "height_m" in df.columns:
+        if weight_col and weight_col in df.columns and height_m is not None:
             w = _safe_num(df[weight_col])
-            h = _safe_num(df["height_m"])
+            h = _safe_num(height_m)
             bmi = w / (h ** 2)
-            df["oba_bmi"] = bmi
-            df["oba_bmi"] = df["oba_bmi"].fillna(df["oba_bmi"].median())
+            new["oba_bmi"] = _fill_stat(bmi, "oba_bmi", "median", stats)
 
     # 체형인지(자기평가) 1~5
     if "oba_01z1" in df.columns:
         map_lbl = {1: "매우마름", 2: "약간마름", 3: "보통", 4: "약간비만", 5: "매우비만"}
-        df["body_perception_cat"] = df["oba_01z1"].map(map_lbl)
-        df["body_perception_cat"] = _ordered_cat(
-            df["body_perception_cat"], ["매우마름", "약간마름", "보통", "약간비만", "매우비만"]
+        new["body_perception_cat"] = _ordered_cat(
+            df["oba_01z1"].map(map_lbl), ["매우마름", "약간마름", "보통", "약간비만", "매우비만"]
         )
-        df["oba_01z1"] = _fill_mode(_safe_num(df["oba_01z1"]))
+        new["oba_01z1"] = _fill_stat(_safe_num(df["oba_01z1"]), "oba_01z1", "mode", stats)
 
     # 체중조절 '시도여부' (1=줄이기,2=유지,3=늘리기,4=안함)
     if "obb_01z1" in df.columns:
         map_lbl = {1: "줄이려했다", 2: "유지하려했다", 3: "늘리려했다", 4: "조절해본적없다"}
-        df["weight_control_attempt_cat"] = df["obb_01z1"].map(map_lbl)
-        df["weight_control_attempt_cat"] = _ordered_cat(
-            df["weight_control_attempt_cat"], ["줄이려했다", "유지하려했다", "늘리려했다", "조절해본적없다"]
+        new["weight_control_attempt_cat"] = _ordered_cat(
+            df["obb_01z1"].map(map_lbl), ["줄이려했다", "유지하려했다", "늘리려했다", "조절해본적없다"]
         )
-        df["obb_01z1"] = _fill_mode(_safe_num(df["obb_01z1"]))
+        new["obb_01z1"] = _fill_stat(_safe_num(df["obb_01z1"]), "obb_01z1", "mode", stats)
 
     # 체중조절 방법(운동/식이/단식… 1/2 → 1/0) + 건강한 방법 비율
     weight_methods = [
@@ -104,23 +119,22 @@ def _feature_obesity_weight(df, weight_col: str | None = None):
     for c in weight_methods:
         if c in df.columns:
             out = c + "_bin"
-            df[out] = df[c].map(_BIN_YN)
-            df[out] = _fill_mode(df[out])
+            new[out] = _fill_stat(df[c].map(_BIN_YN), out, "mode", stats)
             exist.append(out)
 
     if exist:
         # '건강한 방법'(운동+식이)을 단순 지표로
         healthy = [x for x in exist if x.startswith("obb_02a1") or x.startswith("obb_02b1")]
         if healthy:
-            df["healthy_method_ratio"] = df[healthy].sum(axis=1) / len(healthy)
+            new["healthy_method_ratio"] = pd.DataFrame({x: new[x] for x in healthy}).sum(axis=1) / len(healthy)
 
-    return df
+    return new
 
 # -----------------------------------
 # 3) 구강/치과 관련
 # -----------------------------------
-def _feature_oral(df):
-    df = df.copy()
+def _oral_columns(df, stats=None):
+    new = {}
 
     # 최근치과방문 사유 (장벽 요인)
     if "ore_03z2" in df.columns:
@@ -128,75 +142,87 @@ def _feature_oral(df):
             1: "시간없음", 2: "증상경미", 3: "경제적이유", 4: "교통/거리",
             5: "대기시간", 6: "신체/예약어려움", 7: "치료두려움", 8: "기타"
         }
-        df["dental_visit_barrier_cat"] = df["ore_03z2"].map(map_lbl)
-        df["dental_visit_barrier_cat"] = _ordered_cat(
-            df["dental_visit_barrier_cat"],
+        new["dental_visit_barrier_cat"] = _ordered_cat(
+            df["ore_03z2"].map(map_lbl),
             ["시간없음","증상경미","경제적이유","교통/거리","대기시간","신체/예약어려움","치료두려움","기타"]
         )
 
     # 점심 후 양치 여부 (1/2/3) → 이진 + 카테고리
     if "ord_01d2" in df.columns:
         lbl = {1: "예", 2: "아니요", 3: "점심식사안함"}
-        df["brush_after_lunch_cat"] = df["ord_01d2"].map(lbl)
-        df["brush_after_lunch_cat"] = _ordered_cat(df["brush_after_lunch_cat"], ["예","아니요","점심식사안함"])
-        df["brush_after_lunch_bin"] = df["ord_01d2"].map({1: 1, 2: 0, 3: 0})
-        df["brush_after_lunch_bin"] = _fill_mode(df["brush_after_lunch_bin"])
+        new["brush_after_lunch_cat"] = _ordered_cat(df["ord_01d2"].map(lbl), ["예","아니요","점심식사안함"])
+        new["brush_after_lunch_bin"] = _fill_stat(
+            df["ord_01d2"].map({1: 1, 2: 0, 3: 0}), "brush_after_lunch_bin", "mode", stats
+        )
 
     # 양치 불가 이유 (저녁 기준) 1~4 → 카테고리
     if "ord_01f3" in df.columns:
         lbl = {1:"예", 2:"아니요", 3:"저녁/수면없음"}  # 제공 정의 기반
-        df["brush_impossible_evening_cat"] = df["ord_01f3"].map(lbl)
-        df["brush_impossible_evening_cat"] = _ordered_cat(
-            df["brush_impossible_evening_cat"], ["예","아니요","저녁/수면없음"]
+        new["brush_impossible_evening_cat"] = _ordered_cat(
+            df["ord_01f3"].map(lbl), ["예","아니요","저녁/수면없음"]
         )
 
     # 구강건강관리 실천(양치불가 사유) 1~4 → 카테고리
     if "ord_05z1" in df.columns:
         lbl = {1:"시간부족", 2:"장소없음", 3:"주변사람없음", 4:"필요성못느낌"}
-        df["oral_hygiene_barrier_cat"] = df["ord_05z1"].map(lbl)
-        df["oral_hygiene_barrier_cat"] = _ordered_cat(
-            df["oral_hygiene_barrier_cat"], ["시간부족","장소없음","주변사람없음","필요성못느낌"]
+        new["oral_hygiene_barrier_cat"] = _ordered_cat(
+            df["ord_05z1"].map(lbl), ["시간부족","장소없음","주변사람없음","필요성못느낌"]
         )
 
     # 주관적 구강건강 1~5 (Ordered)
     if "ora_01z1" in df.columns:
         lbl = ["매우좋음","좋음","보통","나쁨","매우나쁨"]
-        df["subjective_oral_health_cat"] = _ordered_cat(
+        new["subjective_oral_health_cat"] = _ordered_cat(
             pd.Series(df["ora_01z1"]).map({i+1: l for i, l in enumerate(lbl)}), lbl
         )
-        df["ora_01z1"] = _fill_mode(_safe_num(df["ora_01z1"]))
+        new["ora_01z1"] = _fill_stat(_safe_num(df["ora_01z1"]), "ora_01z1", "mode", stats)
 
     # 치과치료 필요 불편도 1~5 (Ordered)
     if "orb_01z1" in df.columns:
         lbl = ["매우불편","불편","그저그렇다","별로불편X","전혀불편X"]
-        df["dental_discomfort_cat"] = _ordered_cat(
+        new["dental_discomfort_cat"] = _ordered_cat(
             pd.Series(df["orb_01z1"]).map({i+1: l for i, l in enumerate(lbl)}), lbl
         )
-        df["orb_01z1"] = _fill_mode(_safe_num(df["orb_01z1"]))
+        new["orb_01z1"] = _fill_stat(_safe_num(df["orb_01z1"]), "orb_01z1", "mode", stats)
 
-    return df
+    return new
 
 # -----------------------------------
 # 통합 엔트리포인트
 # -----------------------------------
+def my_feature_columns(df, *, weight_col: str | None = None, stats: dict | None = None) -> pd.DataFrame:
+    """
+    apply_my_features가 만들거나 대체하는 컬럼만 DataFrame으로 반환 (df는 수정하지 않음)
+    - 원본 컬럼(oba_bmi, oba_01z1 등)을 결측 대체한 값도 같은 이름으로 포함
+    """
+    new = {}
+    new.update(_diet_columns(df, stats=stats))
+    new.update(_obesity_weight_columns(df, weight_col=weight_col, stats=stats))
+    new.update(_oral_columns(df, stats=stats))
+    return pd.DataFrame(new, index=df.index)
+
 def apply_my_features(
     df: pd.DataFrame,
     *,
     weight_col: str | None = None,  # BMI 직접 계산 시 체중 컬럼명
     copy: bool = True,
-    keep_original: bool = True
+    keep_original: bool = True,
+    stats: dict | None = None
 ) -> pd.DataFrame:
     """
     - 네가 맡은 컬럼(식생활/비만·체중조절/구강)을 한 번에 전처리/파생
     - 결측치 안전 처리(수치=median, 이진=최빈/0, 범주=Unknown)
     - 원본 컬럼은 기본 보존(keep_original=False면 필요 컬럼만 남김)
+    - copy=False면 df에 직접 컬럼을 붙여 반환 (전체 프레임 복사 없음)
+    - stats: 결측 대체 통계 저장/재사용 dict (빈 dict → 계산 후 기록, 채워진 dict → 그대로 재사용)
     """
-    base = _as_copy(df, copy)
-    out = base.copy()
+    new = my_feature_columns(df, weight_col=weight_col, stats=stats)
 
-    out = _feature_diet(out)
-    out = _feature_obesity_weight(out, weight_col=weight_col)
-    out = _feature_oral(out)
+    if copy:
+        out = df.assign(**{col: new[col] for col in new.columns})  # 전체 복사는 여기서 한 번만
+    else:
+        out = df
+        out[new.columns] = new
 
     if keep_original:
         return out
@@ -0,0 +1,110 @@
+# ==================================================
+# 내용: 응답자 ID(exmprs_no) 정수 인코딩
+# 문자열 ID 대신 int64 대리키로 merge/중복제거/결과 저장
+# 대리키 = ID 문자열의 고정 해시 → 프로세스/파일 상태와 무관하게 항상 같은 값 (인코딩 시 파일 쓰기 없음)
+# 역변환용 사전(id_dictionary.csv)은 save_id_dict로 명시적으로만 기록 (잠금 + 원자적 교체)
+# ==================================================
+import os
+import time
+import numpy as np
+import pandas as pd
+from contextlib import contextmanager
+
+from modules.config import DATA_DIR
+
+ID_DICT_FILE = DATA_DIR / "id_dictionary.csv"
+ID_DTYPE = "int64"
+
+# 인코딩 방식 버전: 바뀌면 캐시 키/증분 저장본이 자동 무효화됨 (cache.py, preprocess.py)
+ID_ENCODING = "siphash64-v1"
+_HASH_KEY = "0123456789123456"  # pandas 기본 hash_key (16바이트), 값이 바뀌면 ID_ENCODING도 올릴 것
+
+def hash_ids(values):
+    """ID 문자열 배열 → int64 해시 (같은 ID는 항상 같은 값)"""
+    values = np.asarray(values, dtype=object)
+    return pd.util.hash_array(values, hash_key=_HASH_KEY, categorize=True).view(ID_DTYPE)
+
+def encode_ids(s):
+    """
+    문자열 ID → int64 대리키 (읽기 전용, 사전 파일을 건드리지 않음)
+    이미 정수면(인코딩된 데이터) 그대로 반환
+    서로 다른 ID가 같은 값이 되면(해시 충돌) ValueError
+    """
+    if pd.api.types.is_integer_dtype(s.dtype):
+        return s
+
+    uniques = pd.unique(s.to_numpy(dtype=object))
+    if len(pd.unique(hash_ids(uniques))) != len(uniques):
+        raise ValueError("exmprs_no 해시 충돌이 발생했습니다. ID_ENCODING을 변경해야 합니다.")
+    return pd.Series(hash_ids(s.to_numpy(dtype=object)), index=s.index, name=s.name)
+
+# ==================================================
+# 역변환 사전 (대리키 → 원래 ID)
+# ==================================================
+@contextmanager
+def _file_lock(path, timeout=60, poll=0.1):
+    """{path}.lock 파일을 배타적으로 생성해 다른 프로세스/커널과의 동시 기록 방지"""
+    lock = path.with_name(path.name + ".lock")
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"잠금 파일이 남아 있습니다 (다른 작업 종료 후 삭제): {lock}")
+            time.sleep(poll)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        os.unlink(lock)
+
+def load_id_dict(path=ID_DICT_FILE):
+    """저장된 역변환 사전 로드: 대리키 Index → ID (없으면 빈 Series)"""
+    if not path.exists():
+        return pd.Series([], index=pd.Index([], dtype=ID_DTYPE), dtype=object, name="exmprs_no")
+    df = pd.read_csv(path, dtype={"code": ID_DTYPE, "exmprs_no": str})
+    return pd.Series(df["exmprs_no"].to_numpy(), index=pd.Index(df["code"]), name="exmprs_no")
+
+def _check_against(id_dict, ids):
+    """ids 중 대리키가 사전에 다른 ID로 이미 기록된 것이 있으면 ValueError"""
+    ids = pd.Index(pd.unique(np.asarray(ids, dtype=object)))
+    codes = pd.Index(hash_ids(ids))
+    hit = codes.isin(id_dict.index)
+    stored = id_dict.reindex(codes[hit]).to_numpy(dtype=object)
+    clash = ids[hit][stored != ids[hit].astype(str).to_numpy(dtype=object)]
+    if len(clash):
+        raise ValueError(f"exmprs_no 해시 충돌이 발생했습니다 (기존 ID와 같은 대리키): {clash[:5].tolist()}. ID_ENCODING을 변경해야 합니다.")
+
+def check_id_collisions(ids, path=ID_DICT_FILE):
+    """
+    새 배치의 ID를 사전(이전 배치들의 ID)과 비교해 배치 간 해시 충돌 확인
+    충돌한 ID는 기존 응답자와 같은 대리키가 되어 merge/증분 처리에서 섞이므로 ValueError
+    """
+    _check_against(load_id_dict(path), ids)
+
+def save_id_dict(ids, path=ID_DICT_FILE):
+    """
+    원래 ID(문자열) 목록을 역변환 사전에 추가 (학습 데이터 생성 등 명시적인 단계에서만 호출)
+    기존 사전과 합친 뒤 임시 파일에 쓰고 교체 → 동시에 호출해도 유실/중복 없음
+    기존 사전의 다른 ID와 대리키가 겹치면(해시 충돌) 기록하지 않고 ValueError
+    """
+    ids = pd.Index(pd.unique(np.asarray(ids, dtype=object)))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _file_lock(path):
+        stored = load_id_dict(path)
+        _check_against(stored, ids)
+        new = pd.Series(ids, index=pd.Index(hash_ids(ids)), name="exmprs_no")
+        merged = pd.concat([stored, new[~new.index.isin(stored.index)]])
+        tmp = path.with_name(path.name + ".tmp")
+        merged.rename_axis("code").reset_index().to_csv(tmp, index=False)
+        os.replace(tmp, path)
+    return len(merged)
+
+def decode_ids(codes, path=ID_DICT_FILE):
+    """int64 대리키 → 원래 문자열 ID (사전에 없는 값은 NaN, 결과 파일을 원본과 다시 연결할 때)"""
+    id_dict = load_id_dict(path)
+    index = codes.index if isinstance(codes, pd.Series) else None
+    values = id_dict.reindex(np.asarray(codes, dtype=ID_DTYPE)).to_numpy()
+    return pd.Series(values, index=index, name="exmprs_no")
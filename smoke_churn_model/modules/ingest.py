@@ -0,0 +1,241 @@
+# ==================================================
+# 내용: 설문 CSV 로드 공통 함수
+# 수백 개 컬럼 × 연 23만 행 규모라 기본 C 파서(단일 스레드)는 느림
+# → pyarrow가 설치되어 있으면 멀티스레드 pyarrow 엔진 사용
+# 다른 모듈(config 등)에 의존하지 않으므로 노트북/스크립트에서도 그대로 import 가능
+# 압축 입력(.gz/.zst/.xz)은 임시 파일 없이 파서로 바로 스트리밍 해제
+# SAS/SPSS 배포 원본(.sas7bdat/.sav)도 CSV 변환 없이 같은 함수로 로드
+# ==================================================
+import re
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+def _pyarrow_available():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+def _zstandard_available():
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+# 기본 파서 엔진: pyarrow(멀티스레드) | c(기본 pandas 파서)
+DEFAULT_ENGINE = "pyarrow" if _pyarrow_available() else "c"
+
+# 지원 압축 형식 (pandas가 확장자로 판단해 해제, .zst는 zstandard 없으면 pyarrow 코덱 사용)
+COMPRESSED_SUFFIXES = (".gz", ".zst", ".xz")
+
+def resolve_path(path):
+    """path가 없으면 같은 이름의 압축 파일(raw_data.csv → raw_data.csv.gz 등)을 찾아 반환"""
+    path = Path(path)
+    if path.exists():
+        return path
+    for suffix in COMPRESSED_SUFFIXES:
+        candidate = path.with_name(path.name + suffix)
+        if candidate.exists():
+            return candidate
+    return path
+
+def _open_source(path):
+    """pd.read_csv에 넘길 입력: 경로 그대로, 또는 pyarrow zstd 해제 스트림"""
+    if path.suffix == ".zst" and not _zstandard_available() and _pyarrow_available():
+        import pyarrow as pa
+        return pa.input_stream(str(path), compression="zstd")
+    return path
+
+def read_survey(path, usecols=None, chunksize=None, engine=None, **kwargs):
+    """
+    설문 CSV 로드 (pd.read_csv 대체)
+    - path: CSV 경로 (.gz/.zst/.xz 압축 가능, 없으면 같은 이름의 압축 파일 사용)
+            .sas7bdat/.sav면 read_release로 로드
+    - usecols: 읽을 컬럼 목록 (None이면 전체)
+    - chunksize: 지정 시 청크 이터레이터 반환 (pyarrow 엔진은 청크 미지원 → c 엔진 사용)
+    - engine: pyarrow | c (None이면 DEFAULT_ENGINE)
+    - kwargs: pd.read_csv에 그대로 전달
+    """
+    path = resolve_path(path)
+    if path.suffix.lower() in RELEASE_SUFFIXES:
+        return read_release(path, usecols=usecols, chunksize=chunksize)
+
+    engine = engine or DEFAULT_ENGINE
+    if chunksize is not None:
+        engine = "c"
+    if engine == "c":
+        # c 엔진 기본 float 파서는 마지막 자리가 달라질 수 있음 → pyarrow와 같은 값이 되도록 정확 파싱
+        kwargs.setdefault("float_precision", "round_trip")
+
+    if usecols is not None:
+        usecols = list(usecols)
+        if engine == "pyarrow":
+            # pyarrow 엔진은 usecols 순서대로 반환 → c 엔진과 같은 파일 컬럼 순서로 맞춤
+            source = _open_source(path)
+            header = pd.read_csv(source, nrows=0, **kwargs).columns
+            if source is not path:
+                source.close()
+            missing = [c for c in usecols if c not in set(header)]
+            if missing:
+                # c 엔진과 동일하게 없는 컬럼 요청은 오류 (columns.json 오타 등을 조용히 넘기지 않음)
+                raise ValueError(f"Usecols do not match columns, columns expected but not found: {missing}")
+            wanted = set(usecols)
+            usecols = [c for c in header if c in wanted]
+
+    if engine == "pyarrow" and isinstance(kwargs.get("dtype"), dict) and set(kwargs) == {"dtype"}:
+        return _read_arrow_typed(path, usecols, kwargs["dtype"])
+
+    source = _open_source(path)
+    if chunksize is not None:
+        # 청크 이터레이터가 스트림을 계속 읽으므로 닫지 않음
+        return pd.read_csv(source, usecols=usecols, chunksize=chunksize, engine=engine, **kwargs)
+    try:
+        return pd.read_csv(source, usecols=usecols, engine=engine, **kwargs)
+    finally:
+        if source is not path:
+            source.close()
+
+def _decode_codes(column, dtype):
+    """
+    사전 인코딩(dictionary)으로 파싱한 코드 컬럼 → pandas nullable 정수 배열 (고유값만 숫자로 변환)
+    반환: (배열, 기본 파서였다면 가졌을 dtype: 모두 정수 표기 + 결측 없음 → int64, 그 외 float64)
+    범위를 넘거나 정수가 아닌 값이 있으면 ValueError
+    """
+    column = column.unify_dictionaries()
+    text = column.chunk(0).dictionary.to_pylist() if column.num_chunks else []
+    numbers = pd.to_numeric(pd.Series(text, dtype=object)).to_numpy(dtype="float64")
+    info = np.iinfo(dtype.numpy_dtype)
+    if numbers.size and ((numbers % 1 != 0).any() or numbers.min() < info.min or numbers.max() > info.max):
+        raise ValueError(f"{dtype}로 변환할 수 없는 값이 있습니다: {sorted(set(text))[:10]}")
+
+    mask = column.is_null().to_numpy(zero_copy_only=False)
+    indices = np.concatenate(
+        [chunk.indices.fill_null(0).to_numpy(zero_copy_only=False) for chunk in column.chunks]
+    ) if column.num_chunks else np.zeros(0, dtype="int32")
+    codes = numbers.astype(dtype.numpy_dtype)
+    values = codes[indices] if codes.size else np.zeros(len(indices), dtype=dtype.numpy_dtype)
+
+    int_text = all(_INT_TEXT.fullmatch(t) for t in text)
+    parsed = "int64" if int_text and text and not mask.any() else "float64"
+    return pd.arrays.IntegerArray(values, mask), parsed
+
+_INT_TEXT = re.compile(r"[+-]?\d+")
+
+def _read_arrow_typed(path, usecols, dtype):
+    """
+    pyarrow CSV 파서로 직접 로드하면서 dtype의 nullable 정수 컬럼은 64비트 배열을 만들지 않고 바로 해당 폭으로 변환
+    (pandas pyarrow 엔진은 64비트로 전체를 읽은 뒤 astype → 로드 중 최대 메모리가 줄지 않음)
+    - 정수 컬럼은 사전 인코딩 문자열로 파싱 후 고유값만 숫자로 변환 ("67.0"처럼 저장된 CSV도 허용)
+    - 기본 파서였다면 가졌을 dtype(int64/float64)은 df.attrs["parsed_dtypes"]에 기록
+    - 결측 문자열/전부 결측 컬럼 처리는 pandas pyarrow 엔진과 동일, 범위 초과나 소수 값이 있으면 ValueError
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pv
+    from pandas._libs.parsers import STR_NA_VALUES
+
+    dtype = {col: pd.api.types.pandas_dtype(d) for col, d in dtype.items() if usecols is None or col in usecols}
+    int_dtypes = {
+        col: d for col, d in dtype.items()
+        if isinstance(d, pd.api.extensions.ExtensionDtype) and d.kind in "iu"
+    }
+    convert = pv.ConvertOptions(
+        include_columns=usecols or [],
+        column_types={col: pa.dictionary(pa.int32(), pa.string()) for col in int_dtypes},
+        null_values=sorted(STR_NA_VALUES | {""}),
+        strings_can_be_null=True,
+    )
+    source = _open_source(path)
+    try:
+        table = pv.read_csv(source if source is not path else str(path), convert_options=convert)
+    except pa.ArrowInvalid as e:
+        raise ValueError(e) from e
+    finally:
+        if source is not path:
+            source.close()
+
+    # 정수 코드 컬럼은 pandas 배열로 따로 변환 (테이블에서는 바로 제거해 사전 인코딩 버퍼를 해제)
+    order = table.column_names
+    decoded, parsed_dtypes = {}, {}
+    for col, d in int_dtypes.items():
+        if col not in table.column_names:
+            continue
+        i = table.column_names.index(col)
+        try:
+            decoded[col], parsed_dtypes[col] = _decode_codes(table.column(i), d)
+        except ValueError as e:
+            raise ValueError(f"{col}: {e}") from e
+        table = table.remove_column(i)
+
+    # 전부 결측인 컬럼은 pandas와 같이 float64
+    table = table.cast(pa.schema([
+        field.with_type(pa.float64()) if pa.types.is_null(field.type) else field for field in table.schema
+    ]))
+    df = table.to_pandas()
+    del table
+    df = pd.DataFrame({col: decoded[col] if col in decoded else df[col] for col in order}, copy=False)
+    rest = {col: d for col, d in dtype.items() if col not in int_dtypes and col in df.columns}
+    if rest:
+        df = df.astype(rest)
+    df.attrs["parsed_dtypes"] = parsed_dtypes
+    return df
+
+# ==================================================
+# SAS/SPSS 배포 원본 (KCHS .sas7bdat / .sav)
+# pandas read_sas는 문자 컬럼을 bytes로 반환 → 고유값만 한 번에 디코딩
+# (raw_data.csv의 b'...' 값은 이 bytes를 그대로 CSV로 저장한 흔적)
+# ==================================================
+RELEASE_SUFFIXES = (".sas7bdat", ".sav")
+RELEASE_ENCODING = "cp949"
+
+def decode_bytes(s, encoding=RELEASE_ENCODING):
+    """bytes 컬럼 → 문자열 (고유값 단위 벡터 디코딩, bytes가 아니면 그대로)"""
+    if s.dtype != object:
+        return s
+    codes, uniques = pd.factorize(s)
+    if not len(uniques) or not isinstance(uniques[0], bytes):
+        return s
+    decoded = pd.Index(uniques).str.decode(encoding)
+    return pd.Series(decoded.take(codes, allow_fill=True, fill_value=np.nan), index=s.index, name=s.name)
+
+def _decode_chunk(df, usecols, encoding):
+    if usecols is not None:
+        df = df[[c for c in df.columns if c in usecols]].copy()
+    for col in df.columns[df.dtypes == object]:
+        df[col] = decode_bytes(df[col], encoding)
+    return df
+
+def _iter_sas(path, chunksize):
+    with pd.read_sas(path, format="sas7bdat", encoding=None, chunksize=chunksize) as reader:
+        yield from reader
+
+def _iter_sav(path, usecols, chunksize):
+    try:
+        import pyreadstat
+    except ImportError as e:
+        raise ImportError(".sav 파일을 읽으려면 pyreadstat이 필요합니다: pip install pyreadstat") from e
+    reader = pyreadstat.read_file_in_chunks(pyreadstat.read_sav, str(path), chunksize=chunksize, usecols=usecols)
+    for chunk, _meta in reader:
+        yield chunk
+
+def read_release(path, usecols=None, chunksize=None, encoding=RELEASE_ENCODING):
+    """
+    SAS(.sas7bdat) / SPSS(.sav) 원본 로드
+    - chunksize 지정 시 디코딩된 청크 이터레이터, 미지정 시 전체 DataFrame
+    - usecols: 읽을 컬럼 목록 (SAS는 청크마다 선택)
+    """
+    path = Path(path)
+    if usecols is not None:
+        usecols = list(usecols)
+
+    if path.suffix.lower() == ".sav":
+        chunks = _iter_sav(path, usecols, chunksize or 100_000)
+    else:
+        chunks = _iter_sas(path, chunksize or 100_000)
+
+    decoded = (_decode_chunk(chunk, usecols, encoding) for chunk in chunks)
+    if chunksize is not None:
+        return decoded
+    return pd.concat(decoded, ignore_index=True)
@@ -1,32 +1,52 @@
 # ==================================================
 # 내용: 데이터 정제 및 전처리 코드 통합
 # 1. preprocessing_data(data_path)
-# 2. featuring_data(df_merge)
+# 2. featuring_data(df_merge, targets=None)
 # ==================================================
 import os
 import sys
 import json
+import hashlib
+import warnings
+import importlib
 import pandas as pd
 import numpy as np
+from functools import lru_cache
 
-# 커스텀 모듈 경로
+# 커스텀 모듈 경로 (이미 등록되어 있으면 추가하지 않음)
 from pathlib import Path
 current_path=os.getcwd()
-sys.path.append(os.path.abspath(os.path.join(os.path.join(current_path, 'smoke_churn_model'))))
+module_path = os.path.abspath(os.path.join(os.path.join(current_path, 'smoke_churn_model')))
+if module_path not in sys.path:
+    sys.path.append(module_path)
 
 # 경로 설정
 from modules.config import ROOT_DIR, DATA_DIR, MODEL_DIR
+from modules.cache import load_or_build, cache_path, columns_digest, source_digest, load_feature_cache, save_feature_cache
+from modules.ingest import read_survey, resolve_path, RELEASE_SUFFIXES, DEFAULT_ENGINE
+from modules.ids import encode_ids, save_id_dict, check_id_collisions, ID_ENCODING
 RAW_FILE = DATA_DIR / "raw_data.csv"
 ANAL_FILE =  DATA_DIR / "analy_data_v2.csv"
 PREP_FILE = DATA_DIR / "prep_data_v2.csv" 
+FEATURE_FILE = DATA_DIR / "feature_data.parquet"
 JSON_FILE = ROOT_DIR / "smoke_churn_model" / "resource" / "columns.json"
 
 # 개인 폴더 경로에 있는 columns.json 활용시 → nick_name 본인 경로로 수정
 nick_name = "sosodoit/modules"
 MY_JSON_FILE = ROOT_DIR / "notebooks" / nick_name / "columns.json"
 
-with open(JSON_FILE, "r", encoding="utf-8") as f:
-    columns_dict = json.load(f)
+# columns.json은 import 시점이 아니라 처음 사용할 때 한 번만 로드
+@lru_cache(maxsize=None)
+def get_columns_dict():
+    """columns.json 로드 (첫 호출 시 파싱 후 캐시)"""
+    with open(JSON_FILE, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def __getattr__(name):
+    # 기존 코드 호환: from modules.preprocess import columns_dict
+    if name == "columns_dict":
+        return get_columns_dict()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ==================================================
 # Utill
@@ -35,7 +55,7 @@ def get_columns(*categories):
     """columns.json의 카테고리별 use=y 컬럼 추출"""
     selected = []
     for cat in categories:
-        for col, meta in columns_dict[cat].items():
+        for col, meta in get_columns_dict()[cat].items():
             if meta.get("use", "n") == "y": 
                 selected.append(col)
     
@@ -47,28 +67,310 @@ def get_columns(*categories):
 
     return selected
 
+@lru_cache(maxsize=None)
+def get_alias_index():
+    """코드명 ↔ 한글명(columns.json name) 양방향 인덱스 (첫 호출 시 한 번만 생성)"""
+    code_to_kor = {col: meta["name"] for cat in get_columns_dict().values() for col, meta in cat.items()}
+    kor_to_code = {kor: col for col, kor in code_to_kor.items()}
+    return code_to_kor, kor_to_code
+
+def to_kor_names(cols):
+    """코드명 → 한글명 (매핑 없는 이름은 그대로)"""
+    code_to_kor, _ = get_alias_index()
+    return [code_to_kor.get(c, c) for c in cols]
+
+def to_code_names(cols):
+    """한글명 → 코드명 (매핑 없는 이름은 그대로)"""
+    _, kor_to_code = get_alias_index()
+    return [kor_to_code.get(c, c) for c in cols]
+
 def rename_to_kor(df):
-    """columns.json의 name으로 한글 컬럼명 매핑"""
-    rename_map = {
-        col: meta["name"]
-        for cat in columns_dict.values()
-        for col, meta in cat.items()
-        if col in df.columns
-    }
-    return df.rename(columns=rename_map)
+    """columns.json의 name으로 한글 컬럼명 매핑 (컬럼 라벨만 교체, 데이터는 복사하지 않음)"""
+    return df.set_axis(to_kor_names(df.columns), axis=1, copy=False)
+
+def rename_to_code(df):
+    """한글 컬럼명 → 코드명 (rename_to_kor 역변환, 데이터는 복사하지 않음)"""
+    return df.set_axis(to_code_names(df.columns), axis=1, copy=False)
+
+# 행 식별 컬럼 (항상 로드)
+KEY_COLS = ["exmprs_no", "churn"]
+
+# 전처리 함수별 담당 카테고리
+CATEGORY_GROUPS = {
+    "basic_house": ("기본정보", "가구조사"),
+    "diet_obesity_oral": ("식생활", "비만및체중조절", "구강건강"),
+    "drink_physical": ("음주", "신체활동"),
+    "mental_health": ("정신건강", "보건이용"),
+    "behavior_education": ("건강행태", "교육및경제활동"),
+}
+
+# 원본에 b'...' 형태(bytes repr)로 저장된 식별자 컬럼
+BYTE_COLS = [
+    "EXAMIN_YEAR", "exmprs_no", "CTPRVN_CODE", "PBHLTH_CODE", "SPOT_NO", "HSHLD_CODE",
+    "MBHLD_CODE", "DONG_TY_CODE", "HOUSE_TY_CODE", "signgu_code", "kstrata",
+]
+# 고유값이 행 수에 가까운 컬럼 (나머지는 category로 보관)
+UNIQUE_BYTE_COLS = ["exmprs_no"]
+_BYTE_PATTERN = r"^b'(.*)'$"
+
+def decode_byte_literal(s, as_category=False):
+    """b'...' 문자열에서 따옴표 안쪽 값만 추출 (이미 디코딩된 값은 그대로)"""
+    if s.dtype != object and not isinstance(s.dtype, pd.StringDtype):
+        return s
+
+    if not as_category:
+        return s.str.replace(_BYTE_PATTERN, r"\1", regex=True)
+
+    # 저카디널리티 컬럼: 고유값만 디코딩 후 코드로 복원
+    codes, uniques = pd.factorize(s)
+    decoded = pd.Index(uniques, dtype=object).str.replace(_BYTE_PATTERN, r"\1", regex=True)
+    if not decoded.is_unique:
+        return pd.Series(decoded.take(codes, allow_fill=True, fill_value=np.nan), index=s.index, name=s.name)
+    return pd.Series(pd.Categorical.from_codes(codes, categories=decoded), index=s.index, name=s.name)
+
+def decode_byte_cols(df):
+    """BYTE_COLS 일괄 디코딩 (exmprs_no는 문자열, 나머지는 category)"""
+    for col in BYTE_COLS:
+        if col in df.columns:
+            df[col] = decode_byte_literal(df[col], as_category=col not in UNIQUE_BYTE_COLS)
+    return df
+
+def get_code_rules(cols=None):
+    """
+    columns.json의 응답코드 규칙 추출
+    - recode: 값 치환 (예: 비해당 8 → 1)
+    - na_from: 이 값 이상은 모름/응답거부/비해당 → NaN (7/9, 77/99, 777, 77777)
+    """
+    recodes, sentinels = {}, {}
+    for cat in get_columns_dict().values():
+        for col, meta in cat.items():
+            if cols is not None and col not in cols:
+                continue
+            if "recode" in meta:
+                recodes[col] = {float(k): v for k, v in meta["recode"].items()}
+            if "na_from" in meta:
+                sentinels[col] = meta["na_from"]
+    return recodes, sentinels
+
+def apply_code_rules(df):
+    """recode 적용 후, na_from 이상 코드를 수치 블록 전체에 한 번의 NumPy 마스킹으로 NaN 처리"""
+    recodes, sentinels = get_code_rules(df.columns)
+
+    for col, mapping in recodes.items():
+        df[col] = df[col].replace(mapping)
+
+    cols = [c for c in sentinels if pd.api.types.is_numeric_dtype(df[c])]
+
+    # 작은 nullable 정수형으로 로드한 컬럼(compact 로드)은 dtype을 유지한 채 컬럼별로 마스킹
+    for col in [c for c in cols if _is_nullable_int(df[c].dtype)]:
+        df[col] = df[col].mask(df[col] >= sentinels[col])
+        cols.remove(col)
+    if not cols:
+        return df
+
+    block = df[cols].to_numpy(dtype="float64", copy=True)
+    thresholds = np.array([sentinels[c] for c in cols], dtype="float64")
+    with np.errstate(invalid="ignore"):
+        mask = block >= thresholds
+    block[mask] = np.nan
+
+    # 실제로 값이 바뀐 컬럼만 되돌려 씀 (변경 없는 정수형 컬럼은 dtype 유지)
+    changed = mask.any(axis=0)
+    if changed.any():
+        changed_cols = [c for c, flag in zip(cols, changed) if flag]
+        df[changed_cols] = block[:, changed]
+    return df
+
+# 정수형 후보 (작은 폭부터)
+_UINT_DTYPES = [("UInt8", 2**8 - 1), ("UInt16", 2**16 - 1), ("UInt32", 2**32 - 1)]
+_INT_DTYPES = [("Int8", 2**7 - 1), ("Int16", 2**15 - 1), ("Int32", 2**31 - 1)]
+
+def _smallest_int_dtype(lo, hi):
+    """값 범위 [lo, hi]를 담을 수 있는 가장 작은 nullable 정수형"""
+    candidates = _UINT_DTYPES if lo >= 0 else _INT_DTYPES
+    for dtype, limit in candidates:
+        if hi <= limit and (lo >= 0 or -lo <= limit + 1):
+            return dtype
+    return "Int64"
+
+def _is_nullable_int(dtype):
+    return isinstance(dtype, pd.api.extensions.ExtensionDtype) and dtype.kind in "iu"
+
+def _code_range(meta):
+    """columns.json 항목의 유효 코드 범위 [lo, hi] (domain, 없으면 [min(0, recode 값), na_from - 1])"""
+    recoded = list(meta.get("recode", {}).values())
+    return meta.get("domain", [min([0] + recoded), meta.get("na_from", 1) - 1])
+
+def get_dtype_plan(cols=None):
+    """
+    columns.json 기반 컬럼별 저장 dtype
+    - dtype: 명시 dtype 그대로 사용 (예: wt_p, 소득 → float32)
+    - domain: [최소, 최대] 유효 코드 범위 → 가장 작은 nullable 정수형
+    - na_from만 있으면 domain = [min(0, recode 값), na_from - 1]
+    """
+    plan = {}
+    for cat in get_columns_dict().values():
+        for col, meta in cat.items():
+            if cols is not None and col not in cols:
+                continue
+            if "dtype" in meta:
+                plan[col] = meta["dtype"]
+            elif "domain" in meta or "na_from" in meta:
+                plan[col] = _smallest_int_dtype(*_code_range(meta))
+    return plan
+
+def get_read_dtypes(cols=None):
+    """
+    dtype 계획의 정수형 컬럼을 로드할 때 쓸 dtype (read_survey(dtype=...))
+    원본에는 모름/응답거부 코드(7~9, 77~99, 777~999)가 남아 있으므로 그 코드까지 담는 폭으로 읽음
+    float32/category 컬럼은 기본 dtype으로 읽은 뒤 apply_dtype_plan에서 변환
+    """
+    read_dtypes = {}
+    for cat in get_columns_dict().values():
+        for col, meta in cat.items():
+            if cols is not None and col not in cols:
+                continue
+            if "dtype" in meta:
+                if meta["dtype"].startswith(("Int", "UInt")):
+                    read_dtypes[col] = meta["dtype"]
+            elif "domain" in meta or "na_from" in meta:
+                lo, hi = _code_range(meta)
+                if "na_from" in meta:
+                    hi = max(hi, 10 ** len(str(meta["na_from"])) - 1) # 7 → 9, 77 → 99
+                read_dtypes[col] = _smallest_int_dtype(min(lo, 0), hi)
+    return read_dtypes
+
+def _parsed_dtype(s, parsed_dtypes):
+    """
+    기본 파서로 읽었다면 가졌을 dtype
+    compact 로드한 정수 컬럼: 로드 시 기록(read_survey의 parsed_dtypes), 코드 규칙으로 결측이 생겼으면 float64
+    """
+    if _is_nullable_int(s.dtype):
+        return "float64" if s.hasnans else parsed_dtypes.get(s.name, "int64")
+    return str(s.dtype)
+
+def apply_dtype_plan(df, parsed_dtypes=None):
+    """
+    dtype 계획 적용 (float64 → nullable 정수/float32, 문자열 코드 → category)
+    정수가 아닌 값이나 범위를 벗어난 값이 있는 컬럼은 float32로 대체
+    변환 전 dtype은 df.attrs["source_dtypes"]에 기록 → widen_dtypes에서 그대로 복원 (Parquet 캐시에도 함께 저장)
+    parsed_dtypes: compact 로드 시 read_survey가 기록한 기본 파서 dtype (load_raw(compact=True) 결과의 attrs)
+    """
+    source_dtypes = dict(df.attrs.get("source_dtypes", {}))
+    for col, dtype in get_dtype_plan(df.columns).items():
+        s = df[col]
+        if dtype == "category":
+            if s.dtype == object:
+                source_dtypes.setdefault(col, "object")
+                df[col] = s.astype("category")
+            continue
+        if not pd.api.types.is_numeric_dtype(s):
+            continue
+        source_dtypes.setdefault(col, _parsed_dtype(s, parsed_dtypes or {}))
+        if dtype.startswith(("Int", "UInt")):
+            values = s.dropna()
+            info = np.iinfo(dtype.lower())
+            if values.size and ((values % 1 != 0).any() or values.min() < info.min or values.max() > info.max):
+                dtype = "float32"
+        df[col] = s.astype(dtype)
+    df.attrs["source_dtypes"] = source_dtypes
+    return df
+
+def widen_dtypes(df):
+    """
+    compact dtype(nullable 정수/float32/category) 컬럼을 원래 dtype으로 복원 (피처 함수는 float + NaN 기준으로 작성됨)
+    - apply_dtype_plan이 기록한 변환 전 dtype이 있으면 그대로 복원 (예: age → int64, sex → object)
+    - 기록이 없으면 결측 없는 정수 컬럼은 int64, 결측이 있거나 float32면 float64 (category는 유지)
+    """
+    source_dtypes = df.attrs.get("source_dtypes", {})
+    restore = {}
+    for col, dtype in df.dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            if col in source_dtypes:
+                restore[col] = source_dtypes[col]
+            continue
+        is_int = _is_nullable_int(dtype)
+        if not is_int and dtype != np.float32:
+            continue
+        target = source_dtypes.get(col) or ("int64" if is_int and not df[col].hasnans else "float64")
+        if np.dtype(target).kind in "iu" and df[col].hasnans:
+            target = "float64" # 정수 dtype에는 결측을 담을 수 없음
+        restore[col] = target
+    if restore:
+        df = df.astype(restore)
+    return df
+
+def prepare_raw(df):
+    """원본 공통 정제: b'...' 디코딩 + 응답자 ID 정수 인코딩(ids.py, 파일 쓰기 없음) + 응답코드 규칙"""
+    df = decode_byte_cols(df)
+    if "exmprs_no" in df.columns:
+        df["exmprs_no"] = encode_ids(df["exmprs_no"])
+    return apply_code_rules(df)
+
+def build_id_dict(data):
+    """
+    원본(경로 또는 인코딩 전 DataFrame)의 exmprs_no로 ID 역변환 사전 갱신 → ids.decode_ids 사용 가능
+    로드/스코어링 경로에서는 사전을 쓰지 않으므로, 결과를 원래 ID와 연결해야 할 때 한 번 실행
+    """
+    if isinstance(data, pd.DataFrame):
+        ids = data[["exmprs_no"]].copy()
+    else:
+        ids = read_survey(resolve_path(data), usecols=["exmprs_no"])
+    ids = decode_byte_cols(ids)["exmprs_no"]
+    if pd.api.types.is_integer_dtype(ids.dtype):
+        raise ValueError("이미 정수로 인코딩된 exmprs_no입니다. 원본 데이터를 넘겨주세요.")
+    return save_id_dict(ids)
+
+def _read_compact(path, cols):
+    """
+    dtype 계획의 정수형 컬럼을 작은 dtype으로 바로 로드 (float64 전체 프레임을 거치지 않으므로 로드 중 최대 메모리도 감소)
+    pyarrow 엔진에서만 사용: c 엔진은 범위를 넘는 값을 오류 없이 잘라냄
+    계획과 맞지 않는 값(소수, 범위 초과 코드)이 있으면 경고 후 기본 dtype으로 다시 로드 → apply_dtype_plan이 float32로 대체
+    """
+    path = resolve_path(path)
+    if DEFAULT_ENGINE != "pyarrow" or path.suffix.lower() in RELEASE_SUFFIXES:
+        return read_survey(path, usecols=cols)
+    try:
+        return read_survey(path, usecols=cols, dtype=get_read_dtypes(cols))
+    except ValueError as e:
+        warnings.warn(f"columns.json dtype 계획과 맞지 않는 값 → 기본 dtype으로 다시 로드: {e}", stacklevel=3)
+        return read_survey(path, usecols=cols)
+
+def load_raw(data, *categories, columns=None, compact=False):
+    """
+    카테고리별 use=y 컬럼의 합집합을 한 번만 읽어서 공통 정제 후 반환 (카테고리 미지정 시 전체 그룹)
+    data: 경로 또는 원본 DataFrame
+    columns: 지정 시 이 컬럼(+ KEY_COLS)만 로드 (plan_columns 결과)
+    compact: 경로 입력 시 dtype 계획의 정수형 컬럼을 작은 dtype으로 바로 로드
+    """
+    if not categories:
+        categories = [cat for group in CATEGORY_GROUPS.values() for cat in group]
+    cols = get_columns(*categories)
+    if columns is not None:
+        cols = [c for c in cols if c in columns or c in KEY_COLS]
+
+    if isinstance(data, pd.DataFrame):
+        df = data[[c for c in data.columns if c in cols]].copy()
+    elif compact:
+        df = _read_compact(data, cols)
+    else:
+        df = read_survey(data, usecols=cols)
+    return prepare_raw(df)
+
+def select_columns(data, cols):
+    """data가 경로면 usecols로 로드 후 공통 정제, DataFrame(load_raw 결과)이면 원본 컬럼 순서대로 슬라이스"""
+    if isinstance(data, pd.DataFrame):
+        return data[[c for c in data.columns if c in cols]].copy()
+    return prepare_raw(read_survey(data, usecols=cols))
 
 # ==================================================
 # Data Cleaning
 # ==================================================
-from modules.features_pdy import Liquid_method2
-def make_target(data):
+def label_target(data):
+    """흡연자 필터 + churn 라벨 + 액상형 처리 (행 단위 로직이라 청크별로 적용 가능)"""
 
     # 과거 또는 현재 흡연자만 도출
-    if isinstance(data, pd.DataFrame):
-        anal_data = data[~((data['sma_03z2'] > 3.0) & (data['sma_12z2'] > 2.0) & (data['sma_37z1'] > 3.0))].reset_index(drop=True)
-    else:
-        com_df = pd.read_csv(data)
-        anal_data = com_df[~((com_df['sma_03z2'] > 3.0) & (com_df['sma_12z2'] > 2.0) & (com_df['sma_37z1'] > 3.0))].reset_index(drop=True)
+    anal_data = data[~((data['sma_03z2'] > 3.0) & (data['sma_12z2'] > 2.0) & (data['sma_37z1'] > 3.0))].reset_index(drop=True)
 
     # 현재 흡연 여부. 하나라도 현재 피우고 있으면 흡연 중
     currently_smoking = (
@@ -92,165 +394,201 @@ def make_target(data):
     )
     
     # 액상형 관련 처리: 액상형 피워봤고, 최근 한 달 동안 피운 일수가 0을 초과하는데 churn이 1이면 0으로 변경
-    anal_data = Liquid_method2(anal_data)
-    anal_data.to_csv(ANAL_FILE, index=False, encoding='utf-8-sig')
+    anal_data = load_feature("features_pdy.Liquid_method2")(anal_data)
+
+    return anal_data
+
+def make_target(data, use_cache=True, save_path=None):
+    """
+    data: 원본 경로(.gz/.zst/.xz 압축, .sas7bdat/.sav 가능) 또는 이미 로드한 DataFrame (입력 DataFrame은 수정하지 않음)
+    use_cache: 경로 입력 시 원본을 Parquet 캐시에서 로드
+    save_path: 지정 시에만 라벨 결과를 CSV로 저장 (예: ANAL_FILE). 기본은 디스크 I/O 없음
+    """
+    if isinstance(data, pd.DataFrame):
+        com_df = data
+    elif use_cache:
+        data = resolve_path(data) # 압축 파일만 있는 경우 캐시 키도 압축 파일 기준
+        # SAS/SPSS 원본은 청크 단위로 디코딩해 캐시(Parquet)에 바로 기록
+        chunksize = CHUNK_SIZE if data.suffix.lower() in RELEASE_SUFFIXES else None
+        com_df = load_or_build(data, "raw", lambda: read_survey(data, chunksize=chunksize))
+    else:
+        com_df = read_survey(data)
+
+    anal_data = label_target(com_df)
+    if save_path is not None:
+        anal_data.to_csv(save_path, index=False, encoding='utf-8-sig')
 
     return anal_data
 
 # ==================================================
-# 1. 기본정보 + 가구조사 
+# 카테고리별 정제
+# 'b' 문자 전처리, 값 변경(recode), NaN 변경(na_from)은
+# columns.json 규칙으로 load_raw/select_columns에서 일괄 처리
 # ==================================================
-def preprocess_basic_house(data_path):
-    cols = get_columns("기본정보", "가구조사")
-    df = pd.read_csv(data_path, usecols=cols)
 
-    # 'b' 문자 전처리
-    if "exmprs_no" in df.columns:
-        df['exmprs_no'] = df['exmprs_no'].apply(lambda x: x.split("'")[1])
+# ==================================================
+# 1. 기본정보 + 가구조사 
+# ==================================================
+def preprocess_basic_house(data):
+    cols = get_columns(*CATEGORY_GROUPS["basic_house"])
+    df = select_columns(data, cols)
 
-    if "CTPRVN_CODE" in df.columns:
-        df['CTPRVN_CODE'] = df['CTPRVN_CODE'].apply(lambda x: x.split("'")[1])
-    
-    if "SPOT_NO" in df.columns:
-        df['SPOT_NO'] = df['SPOT_NO'].apply(lambda x: x.split("'")[1])
-    
     if "sex" in df.columns:
         df['sex'] = df['sex'].apply(lambda x: 1 if x == 1 else 2).astype(str)
 
-    # NaN 변경
-    for col in ["fma_04z1", "nue_01z1", "fma_27z1", "fma_26z1"]:
-        if col in df.columns:
-            df.loc[df[col] >= 7, col] = np.nan
-
-    for col in ["fma_13z1", "fma_14z1"]:
-        if col in df.columns:
-            df.loc[df[col] >= 77777, col] = np.nan
-
-    for col in ["fma_24z2"]:
-            if col in df.columns:
-                df.loc[df[col] >= 77, col] = np.nan
-
     return df
 
 # ==================================================
 # 2. 식생활 + 비만및체중조절 + 구강건강
 # ==================================================
-def preprocess_diet_obesity_oral(data_path):
-    cols = get_columns("식생활", "비만및체중조절", "구강건강")
-    df = pd.read_csv(data_path, usecols=cols)
-
-    # 'b' 문자 전처리
-    if "exmprs_no" in df.columns:
-        df['exmprs_no'] = df['exmprs_no'].apply(lambda x: x.split("'")[1])
-
-    # NaN 변경
-    for col in ["nua_01z2", "nuc_02z1", "nuc_03z1", "obb_02a1", "obb_02b1", "obb_02d1", "ora_01z1", "orb_01z1", "ord_01d2", "ord_05z1", "ord_01f3"]:
-        if col in df.columns:
-            df.loc[df[col] >= 7, col] = np.nan
-
-    for col in ["ore_03z2"]:
-            if col in df.columns:
-                df.loc[df[col] >= 77, col] = np.nan
+def preprocess_diet_obesity_oral(data):
+    cols = get_columns(*CATEGORY_GROUPS["diet_obesity_oral"])
+    df = select_columns(data, cols)
 
     return df
 
 # ==================================================
 # 3. 음주 + 신체활동
 # ==================================================
-def preprocess_drink_physical(data_path):
-    cols = get_columns("음주", "신체활동")
-    df = pd.read_csv(data_path, usecols=cols)
-
-    # 'b' 문자 전처리
-    if "exmprs_no" in df.columns:
-        df['exmprs_no'] = df['exmprs_no'].apply(lambda x: x.split("'")[1])
-
-    # 값 변경
-    if "drb_01z3" in df.columns:
-        df["drb_01z3"] = df["drb_01z3"].replace(8, 1)
-
-    if "drb_03z1" in df.columns:
-        df["drb_03z1"] = df["drb_03z1"].replace(8, -1)
-
-    # NaN 변경 
-    for col in ["drb_01z3", "drb_03z1", "drg_01z3", "pha_11z1", "drb_04z1", "drb_05z1"]:
-        if col in df.columns:
-            df.loc[df[col] >= 7, col] = np.nan
-
-    for col in ["pha_04z1", "pha_07z1", "phb_01z1"]:
-            if col in df.columns:
-                df.loc[df[col] >= 77, col] = np.nan
+def preprocess_drink_physical(data):
+    cols = get_columns(*CATEGORY_GROUPS["drink_physical"])
+    df = select_columns(data, cols)
 
     return df
 
 # ==================================================
 # 4. 정신건강 + 보건이용
 # ==================================================
-def preprocess_mental_health(data_path):
-    cols = get_columns("정신건강", "보건이용")
-    df = pd.read_csv(data_path, usecols=cols)
-
-    # 'b' 문자 전처리
-    if "exmprs_no" in df.columns:
-        df['exmprs_no'] = df['exmprs_no'].apply(lambda x: x.split("'")[1])
-
-    # NaN 변경 
-    for col in ["mta_01z1", "mta_02z1", "mtc_08z1", "mtc_12c1", "mtc_12h1", "mtj_05z2", "mtj_10z1", "mtj_11z1"]:
-        if col in df.columns:
-            df.loc[df[col] >= 7, col] = np.nan
-
-    for col in ["edit_mtc_03z1"]:
-            if col in df.columns:
-                df.loc[df[col] >= 77, col] = np.nan
+def preprocess_mental_health(data):
+    cols = get_columns(*CATEGORY_GROUPS["mental_health"])
+    df = select_columns(data, cols)
 
     return df
 
 # ==================================================
 # 5. 건강행태 + 교육및경제활동
 # ==================================================
-def preprocess_behavior_education(data_path):
-    cols = get_columns("건강행태", "교육및경제활동")
-    df = pd.read_csv(data_path, usecols=cols)
-
-    # 'b' 문자 전처리
-    if "exmprs_no" in df.columns:
-        df['exmprs_no'] = df['exmprs_no'].apply(lambda x: x.split("'")[1])
-
-    # NaN 변경
-    for col in ["smf_01z1", "sma_01z1", "sma_03z2", "smb_09z1", "sma_36z1", "sma_37z1", "sma_08z1", "sma_12z2"\
-                "smd_02z3", "smd_01z3", "smc_08z2", "smc_09z2", "smc_10z2", "sob_02z1", "soa_01z1", "soa_07z1", "sod_02z3"]:
-        if col in df.columns:
-            df.loc[df[col] >= 7, col] = np.nan
+def preprocess_behavior_education(data):
+    cols = get_columns(*CATEGORY_GROUPS["behavior_education"])
+    df = select_columns(data, cols)
 
-    for col in ["smb_02z1", "smb_05z1", "sma_11z2", "sob_01z1", "soa_06z2", "smb_12z1"]:
-            if col in df.columns:
-                df.loc[df[col] >= 77, col] = np.nan
-
-    for col in ["smb_01z1", "smb_13z1", "smb_03z1", "smb_04z1", "smb_06z1", "smb_11z1"]:
-            if col in df.columns:
-                df.loc[df[col] >= 777, col] = np.nan
     return df
 
-def preprocessing_data(DATA_PATH):
-
-    """DATA_PATH: churn 라벨 포함된 데이터 경로"""
-    df_basic = preprocess_basic_house(DATA_PATH)
-    df_health = preprocess_diet_obesity_oral(DATA_PATH)
-    df_drink = preprocess_drink_physical(DATA_PATH)
-    df_mental = preprocess_mental_health(DATA_PATH)
-    df_behavior = preprocess_behavior_education(DATA_PATH)
+def assemble_frames(dfs, how="index"):
+    """
+    카테고리별 정제 결과를 하나의 df_merge로 결합
+    - how="index": 모두 같은 파일의 같은 행이므로 행 인덱스 기준으로 컬럼만 이어붙임 (행 식별자 일치 검사)
+    - how="merge": 기존 방식 (exmprs_no, churn 기준 outer merge)
+    """
+    if how == "merge":
+        df_merge = dfs[0]
+        for temp in dfs[1:]:
+            join_cols = [c for c in KEY_COLS if c in df_merge.columns and c in temp.columns]
+            if join_cols:
+                df_merge = pd.merge(df_merge, temp, on=join_cols, how="outer")
+        return df_merge
+
+    if how != "index":
+        raise ValueError(f"지원하지 않는 결합 방식입니다: {how} (index | merge)")
+
+    base = dfs[0]
+    parts = [base]
+    for temp in dfs[1:]:
+        if not temp.index.equals(base.index):
+            raise ValueError("행 인덱스가 일치하지 않아 index 결합을 할 수 없습니다.")
+        key_cols = [c for c in KEY_COLS if c in base.columns and c in temp.columns]
+        for col in key_cols:
+            if not temp[col].equals(base[col]):
+                raise ValueError(f"행 식별자가 일치하지 않아 index 결합을 할 수 없습니다: {col}")
+        parts.append(temp.drop(columns=key_cols))
+
+    return pd.concat(parts, axis=1)
+
+def preprocessing_data(DATA_PATH, how="index", use_cache=True, compact=False, columns=None):
+
+    """
+    DATA_PATH: churn 라벨 포함된 데이터 경로(.gz/.zst/.xz 압축 가능) 또는 이미 로드한 DataFrame
+    how: 카테고리별 결과 결합 방식 (index: 행 인덱스 정렬 | merge: 기존 outer merge)
+    use_cache: 경로 입력 시 정제 결과를 Parquet 캐시에서 로드/저장 (원본 해시 + columns.json 기준)
+    compact: columns.json dtype 계획 적용 (응답코드 → UInt8 등, 가중치/소득 → float32)
+    columns: 로드할 원본 컬럼 제한 (plan_columns(모델 입력 컬럼) 결과)
+    """
+    if use_cache and not isinstance(DATA_PATH, pd.DataFrame):
+        DATA_PATH = resolve_path(DATA_PATH)
+        tag = f"prep_{how}{'_compact' if compact else ''}"
+        if columns is not None:
+            tag += "_" + hashlib.sha1(",".join(sorted(columns)).encode()).hexdigest()[:8]
+        hit = cache_path(DATA_PATH, tag, get_columns_dict()).exists()
+        df_merge = load_or_build(
+            DATA_PATH, tag,
+            lambda: preprocessing_data(DATA_PATH, how=how, use_cache=False, compact=compact, columns=columns),
+            columns_dict=get_columns_dict(),
+        )
+        if hit: # 새로 만든 경우는 preprocessing_data(use_cache=False)에서 이미 출력
+            print("(전처리)데이터 크기:", df_merge.shape, '(캐시)')
+        return df_merge
+
+    # 원본은 한 번만 읽고, 카테고리별 정제는 컬럼 슬라이스로 수행
+    df_raw = load_raw(DATA_PATH, columns=columns, compact=compact)
+
+    df_basic = preprocess_basic_house(df_raw)
+    df_health = preprocess_diet_obesity_oral(df_raw)
+    df_drink = preprocess_drink_physical(df_raw)
+    df_mental = preprocess_mental_health(df_raw)
+    df_behavior = preprocess_behavior_education(df_raw)
 
     dfs = [df_basic, df_health, df_drink, df_mental, df_behavior]
-    df_merge = dfs[0]
-    for temp in dfs[1:]:
-        join_cols = [c for c in ["exmprs_no", "churn"] if c in df_merge.columns and c in temp.columns]
-        if join_cols:
-            df_merge = pd.merge(df_merge, temp, on=join_cols, how="outer")
+    df_merge = assemble_frames(dfs, how=how)
+
+    if compact:
+        df_merge = apply_dtype_plan(df_merge, df_raw.attrs.get("parsed_dtypes"))
 
     print("(전처리)데이터 크기:", df_merge.shape, '(2개 제외)')
 
     return df_merge
 
+# ==================================================
+# Streaming: 청크 단위 처리 (메모리 사용량을 청크 크기로 제한)
+# ==================================================
+CHUNK_SIZE = 50_000
+
+def _stream_csv(in_path, out_path, process, chunksize=CHUNK_SIZE, usecols=None):
+    """in_path를 chunksize 행씩 읽어 process(chunk) 결과를 out_path에 이어쓰기, 저장된 행 수 반환"""
+    n_rows = 0
+    first = True
+    for chunk in read_survey(in_path, usecols=usecols, chunksize=chunksize):
+        out = process(chunk)
+        out.to_csv(out_path, mode="w" if first else "a", header=first, index=False, encoding='utf-8-sig')
+        n_rows += len(out)
+        first = False
+    return n_rows
+
+def make_target_stream(raw_path, out_path=ANAL_FILE, chunksize=CHUNK_SIZE):
+    """make_target 스트리밍 버전: 원본을 청크 단위로 라벨링 후 out_path에 이어쓰기"""
+    n_rows = _stream_csv(raw_path, out_path, label_target, chunksize=chunksize)
+    print("(타겟)데이터 크기:", n_rows, "행 →", out_path)
+    return out_path
+
+def preprocessing_data_stream(DATA_PATH, out_path=PREP_FILE, chunksize=CHUNK_SIZE, columns=None):
+    """preprocessing_data 스트리밍 버전: 청크별 정제(디코딩, 코드 규칙, 카테고리 정제) 후 out_path에 이어쓰기"""
+    categories = [cat for group in CATEGORY_GROUPS.values() for cat in group]
+    usecols = [c for c in get_columns(*categories) if columns is None or c in columns or c in KEY_COLS]
+
+    def process(chunk):
+        df_raw = load_raw(chunk)
+        dfs = [
+            preprocess_basic_house(df_raw),
+            preprocess_diet_obesity_oral(df_raw),
+            preprocess_drink_physical(df_raw),
+            preprocess_mental_health(df_raw),
+            preprocess_behavior_education(df_raw),
+        ]
+        return assemble_frames(dfs, how="index")
+
+    n_rows = _stream_csv(DATA_PATH, out_path, process, chunksize=chunksize, usecols=usecols)
+    print("(전처리)데이터 크기:", n_rows, "행 →", out_path)
+    return out_path
+
 # ==================================================
 # Feature Enginerring
 # ==================================================
@@ -266,30 +604,163 @@ def scaling_feature(train_data, test_data):
     """특성 스케일링"""
     pass
 
-# 이곳에 담당 모듈 임포트 추가
-from modules.features_ksh import feature_age_group, feature_is_single, feature_house_income, feature_dementia_case, feature_smoke_avg_per_day
-from modules.features_mhs import feature_time_col
-from modules.features_ohj import feature_education_group, feature_is_economically_active, feature_occupation_type, feature_is_employee, feature_marital_stability
-from modules.features_pdy import feature_weight_control_method, feature_activity_score_and_weight
-from modules.features_sangmin import apply_my_features
+@lru_cache(maxsize=None)
+def load_feature(name):
+    """'모듈.함수' 이름으로 피처 함수 로드 (담당 모듈은 처음 사용할 때 import)"""
+    module_name, func_name = name.rsplit(".", 1)
+    return getattr(importlib.import_module(f"modules.{module_name}"), func_name)
+
+# 피처 함수별 입력/출력 컬럼 선언 (피처 레지스트리)
+# 실행 순서: 입력/출력 의존 관계 우선, 그 외에는 리스트 순서 (feature_order)
+# func: '담당모듈.함수' 이름 → 이곳에 담당 모듈 피처 추가
+# partial=True: 입력 컬럼 일부가 없어도 함수 내부에서 있는 컬럼만 처리
+# stateful=True: 데이터셋 전체 통계(median/최빈값)를 사용 → stats dict로 통계 저장/재사용
+# kwargs: 함수에 넘길 추가 인자
+FEATURE_PIPELINE = [
+    {"func": "features_ksh.feature_age_group", "inputs": ["age"], "outputs": ["age_group"]},
+    {"func": "features_ksh.feature_is_single", "inputs": ["mbhld_co"], "outputs": ["is_single"]},
+    {"func": "features_ksh.feature_house_income", "inputs": ["fma_14z1", "fma_13z1", "fma_24z2"],
+     "outputs": ["house_income", "house_income_log", "house_income_grp"]},
+    {"func": "features_ksh.feature_dementia_case", "inputs": ["fma_27z1", "fma_26z1"], "outputs": ["fma_dementia_case"]},
+    {"func": "features_ksh.feature_smoke_avg_per_day", "inputs": ["smb_01z1", "smb_03z1", "smb_06z1"], "outputs": ["smoke_avg_per_day"]},
+    {"func": "features_mhs.feature_time_col", "partial": True,
+     "inputs": ["edit_mtc_03z1", "mtc_04z1", "mtc_05z1", "mtc_06z1", "mtc_08z1", "mtc_09z1", "mtc_10z1", "mtc_11z1"],
+     "outputs": ["edit_mtc_03z1", "mtc_05z1", "mtc_08z1", "mtc_10z1"]},
+    {"func": "features_ohj.feature_education_group", "inputs": ["sob_01z1"], "outputs": ["education_group"]},
+    {"func": "features_ohj.feature_is_economically_active", "inputs": ["soa_01z1"], "outputs": ["is_economically_active"]},
+    {"func": "features_ohj.feature_occupation_type", "inputs": ["soa_06z2"], "outputs": ["occupation_type"]},
+    {"func": "features_ohj.feature_is_employee", "inputs": ["soa_07z1"], "outputs": ["is_employee"]},
+    {"func": "features_pdy.feature_weight_control_method", "inputs": ["obb_02a1", "obb_02b1", "obb_02d1"], "outputs": ["weight_control_method"]},
+    {"func": "features_pdy.feature_activity_score_and_weight", "inputs": ["pha_04z1", "pha_06z1", "phb_01z1"],
+     "outputs": ["activity_score_weight", "activity_score"]},
+    {"func": "features_sangmin.apply_my_features", "partial": True, "stateful": True, # 12개 피처생성 | 19개 삭제
+     "kwargs": {"copy": False}, # 다른 피처 함수처럼 df_merge에 바로 컬럼 추가 (전체 복사 없음)
+     "inputs": ["nua_01z2", "nuc_02z1", "nuc_01z2", "nuc_03z1", "oba_02z1", "oba_bmi", "oba_01z1", "obb_01z1",
+                "obb_02a1", "obb_02b1", "obb_02c1", "obb_02d1", "obb_02e1", "obb_02f1", "obb_02g1", "obb_02h1", "obb_02i1",
+                "ore_03z2", "ord_01d2", "ord_01f3", "ord_05z1", "ora_01z1", "orb_01z1"],
+     "outputs": ["breakfast_freq_cat", "breakfast_freq_score", "nutrition_awareness_bin", "nutrition_usage_bin",
+                 "nutrition_interest_bin", "height_m", "oba_bmi", "body_perception_cat", "oba_01z1",
+                 "weight_control_attempt_cat", "obb_01z1", "obb_02a1_bin", "obb_02b1_bin", "obb_02c1_bin",
+                 "obb_02d1_bin", "obb_02e1_bin", "obb_02f1_bin", "obb_02g1_bin", "obb_02h1_bin", "obb_02i1_bin",
+                 "healthy_method_ratio", "dental_visit_barrier_cat", "brush_after_lunch_cat", "brush_after_lunch_bin",
+                 "brush_impossible_evening_cat", "oral_hygiene_barrier_cat", "subjective_oral_health_cat",
+                 "ora_01z1", "dental_discomfort_cat", "orb_01z1"]},
+    {"func": "features_ohj.feature_marital_stability", "inputs": ["sod_02z3"], "outputs": ["marital_stability"]},
+]
+
+def _load_targets(targets):
+    """컬럼 목록 또는 그 목록을 담은 json 경로 → 목록"""
+    if isinstance(targets, (str, Path)):
+        with open(targets, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return list(targets)
+
+def feature_order(specs=None):
+    """
+    피처 spec 실행 순서: 다른 피처의 출력을 입력으로 쓰는 피처는 그 피처 뒤에 실행 (위상 정렬)
+    - 순서 제약이 없는 피처끼리는 FEATURE_PIPELINE 등록 순서 유지
+    - 자기 입력 컬럼을 덮어쓰는 피처(입력=출력)는 자기 자신에 대한 의존으로 보지 않음
+    """
+    specs = FEATURE_PIPELINE if specs is None else specs
+    producers = {}
+    for i, spec in enumerate(specs):
+        for col in spec["outputs"]:
+            producers.setdefault(col, set()).add(i)
+    deps = [{j for col in spec["inputs"] for j in producers.get(col, ()) if j != i} for i, spec in enumerate(specs)]
+
+    order, done = [], set()
+    while len(order) < len(specs):
+        ready = [i for i in range(len(specs)) if i not in done and deps[i] <= done]
+        if not ready:
+            cycle = [specs[i]["func"] for i in range(len(specs)) if i not in done]
+            raise ValueError(f"피처 입력/출력 선언에 순환 의존이 있습니다: {cycle}")
+        order.append(ready[0])
+        done.add(ready[0])
+    return [specs[i] for i in order]
+
+def resolve_features(targets=None):
+    """
+    targets(모델 입력 컬럼)를 만드는 데 필요한 피처 spec만 실행 순서대로 반환
+    targets: 컬럼 목록(코드명/한글명 모두 가능) 또는 그 목록을 담은 json 경로, None이면 전체 피처
+    - 필요한 피처의 입력을 만드는 피처도 함께 포함 (출력 → 입력 역추적)
+    """
+    specs = feature_order()
+    if targets is None:
+        return specs
+
+    required = set(to_code_names(_load_targets(targets)))
+    needed = []
+    for spec in reversed(specs):
+        if required & set(spec["outputs"]):
+            required |= set(spec["inputs"])
+            needed.append(spec)
+    return needed[::-1]
+
+def plan_columns(targets):
+    """
+    최종 모델 입력 컬럼에서 피처 함수의 입력 선언을 역추적해, 원본에서 읽어야 할 최소 컬럼 목록 계산
+    targets: 모델 입력 컬럼 목록(코드명/한글명 모두 가능) 또는 그 목록을 담은 json 경로
+    → preprocessing_data(..., columns=plan_columns(targets)) 후 featuring_data(..., targets=targets)
+    """
+    targets = _load_targets(targets)
+    required = set(to_code_names(targets))
+    for spec in resolve_features(targets):
+        required |= set(spec["inputs"])
+
+    catalog = [col for cat in get_columns_dict().values() for col in cat]
+    return [col for col in catalog if col in required]
+
+def _run_feature(df_merge, spec, kwargs, use_cache=False):
+    """
+    피처 함수 실행 (피처 캐시 사용)
+    입력 컬럼 값·dtype, 함수 소스(같은 모듈 헬퍼/상수 포함), 추가 인자가 모두 같으면 저장된 출력 컬럼을 붙이고 함수는 건너뜀
+    stateful 피처에 stats를 넘기는 경우(통계 기록/재사용)는 캐시하지 않음
+    """
+    func = load_feature(spec["func"])
+    if not use_cache or "stats" in kwargs:
+        return func(df_merge, **kwargs)
+
+    inputs = [col for col in spec["inputs"] if col in df_merge.columns]
+    key = hashlib.sha256("|".join([
+        source_digest(func), columns_digest(df_merge, inputs), repr(sorted(kwargs.items()))
+    ]).encode()).hexdigest()
+
+    cached = load_feature_cache(spec["func"], key)
+    if cached is not None:
+        for col in cached.columns:
+            df_merge[col] = cached[col].set_axis(df_merge.index)
+        return df_merge
+
+    df_merge = func(df_merge, **kwargs)
+    outputs = [col for col in df_merge.columns if col in spec["outputs"]]
+    save_feature_cache(spec["func"], key, df_merge[outputs])
+    return df_merge
 
-def featuring_data(df_merge):
+def featuring_data(df_merge, stats=None, targets=None, use_cache=False, columns=None):
     
-    """이곳에 생성할 피처 추가"""
-    df_merge = feature_age_group(df_merge)
-    df_merge = feature_is_single(df_merge)
-    df_merge = feature_house_income(df_merge)
-    df_merge = feature_dementia_case(df_merge)
-    df_merge = feature_smoke_avg_per_day(df_merge)
-    df_merge = feature_time_col(df_merge)
-    df_merge = feature_education_group(df_merge)
-    df_merge = feature_is_economically_active(df_merge)
-    df_merge = feature_occupation_type(df_merge)
-    df_merge = feature_is_employee(df_merge)
-    df_merge = feature_weight_control_method(df_merge)
-    df_merge = feature_activity_score_and_weight(df_merge)
-    df_merge = apply_my_features(df_merge) # 12개 피처생성 | 19개 삭제
-    df_merge = feature_marital_stability(df_merge)
+    """
+    이곳에 생성할 피처 추가 → FEATURE_PIPELINE에 입력/출력 컬럼과 함께 등록
+    stats: stateful 피처의 결측 대체 통계 dict (None이면 매번 현재 데이터로 계산)
+    targets: 모델 입력 컬럼 목록 또는 json 경로 → 이 컬럼을 만드는 데 필요한 피처만 실행 (None이면 전체)
+    columns: preprocessing_data(columns=...)로 로드 컬럼을 줄였으면 같은 목록 → 입력이 없는 피처는 건너뜀
+    - targets/columns 둘 다 없으면(전체 실행) 입력 컬럼이 없는 피처는 KeyError (원본 컬럼명 변경/누락 감지)
+    use_cache: 피처별 출력 캐시 사용 (입력 컬럼/함수 소스가 바뀐 피처만 다시 계산)
+    - 기본 False: 작은 입력은 해시/파일 I/O가 계산보다 비쌈 → 전체 데이터 배치/노트북에서만 True로 지정
+    """
+    df_merge = widen_dtypes(df_merge) # compact dtype → 원래 dtype
+    for spec in resolve_features(targets):
+        missing = [col for col in spec["inputs"] if col not in df_merge.columns]
+        if missing and not spec.get("partial"):
+            if targets is None and columns is None:
+                raise KeyError(f"{spec['func']}: 입력 컬럼이 없습니다 {missing}")
+            if targets is not None:
+                # targets에 필요한 피처인데 입력이 없음 → 해당 모델 컬럼이 만들어지지 않음
+                warnings.warn(f"{spec['func']} 건너뜀: 입력 컬럼 없음 {missing}", stacklevel=2)
+            continue
+        kwargs = dict(spec.get("kwargs", {}))
+        if spec.get("stateful") and stats is not None:
+            kwargs["stats"] = stats
+        df_merge = _run_feature(df_merge, spec, kwargs, use_cache=use_cache)
 
     return df_merge
 
@@ -302,4 +773,102 @@ def drop_feature(df_merge):
                               'obb_02d1', 'obb_02e1', 'obb_02f1', 'obb_02g1', 'obb_02h1', 'obb_02i1',
                               'ore_03z2', 'ord_01d2', 'ord_01f3', 'ord_05z1', 'ora_01z1', 'orb_01z1'],
                               axis=1, errors='ignore') # sangmin
-    return df_merge
\ No newline at end of file
+    return df_merge
+
+# ==================================================
+# Incremental: 새 조사 차수에 추가된 응답자만 처리 후 이어붙이기
+# 저장본: FEATURE_FILE (featuring_data 결과 + 조사연도), {저장본}.stats.json (stateful 피처 통계),
+#         {저장본}.ids.csv (저장된 응답자의 원래 ID → 배치 간 해시 충돌 확인용)
+# ==================================================
+INCREMENTAL_KEYS = ["exmprs_no", "EXAMIN_YEAR"]
+REFIT_RATIO = 0.2
+
+def _stats_path(store_path):
+    return Path(store_path).with_suffix(".stats.json")
+
+def _ids_path(store_path):
+    return Path(store_path).with_suffix(".ids.csv")
+
+def needs_refit(n_stored, n_new, columns=None, refit_ratio=REFIT_RATIO):
+    """
+    stateful 피처 통계를 다시 계산해야 하는지 판단
+    - 로드 컬럼(columns) 기준으로 stateful 피처가 실행되지 않으면 재계산 불필요
+    - 신규 행이 저장된 행의 refit_ratio를 넘으면 저장된 통계가 낡은 것으로 보고 재계산
+    """
+    stateful_inputs = {col for spec in FEATURE_PIPELINE if spec.get("stateful") for col in spec["inputs"]}
+    if columns is not None and not stateful_inputs & set(columns):
+        return False
+    return n_new > n_stored * refit_ratio
+
+def featuring_data_incremental(DATA_PATH, store_path=FEATURE_FILE, refit_ratio=REFIT_RATIO, columns=None):
+    """
+    exmprs_no(+EXAMIN_YEAR) 기준으로 저장본에 없는 행만 전처리 → 피처생성 후 저장본에 이어붙임
+    DATA_PATH: churn 라벨 포함된 데이터 경로 또는 DataFrame (make_target 결과)
+    - stateful 피처는 저장된 통계(median/최빈값)를 그대로 재사용
+    - 저장본이 없거나 needs_refit이면 전체 재계산 후 통계도 새로 저장
+    - 신규 ID의 대리키가 저장된 다른 ID와 같으면(해시 충돌) 이어붙이기 전에 ValueError
+    반환: featuring_data 결과 (drop_feature 전, 조사연도 제외)
+    """
+    store_path, stats_path, ids_path = Path(store_path), _stats_path(store_path), _ids_path(store_path)
+    df_src = DATA_PATH if isinstance(DATA_PATH, pd.DataFrame) else read_survey(DATA_PATH)
+    df_src = df_src.reset_index(drop=True) # 조사연도를 행 인덱스로 다시 붙이기 위해 고유 인덱스 보장
+    keys = [k for k in INCREMENTAL_KEYS if k in df_src.columns]
+    src_keys = decode_byte_cols(df_src[keys].copy())
+    # 이미 정수로 인코딩된 입력은 원래 ID가 없으므로 충돌 확인/ID 기록 생략
+    raw_ids = None if pd.api.types.is_integer_dtype(src_keys["exmprs_no"].dtype) else src_keys["exmprs_no"]
+    src_keys["exmprs_no"] = encode_ids(src_keys["exmprs_no"])
+
+    stored, stats = None, None
+    if store_path.exists() and stats_path.exists():
+        stored = pd.read_parquet(store_path)
+        with open(stats_path, "r", encoding="utf-8") as f:
+            stats = json.load(f)
+        # ID 인코딩 방식이 다른 저장본은 키 비교가 불가능하므로 전체 재계산
+        # ID 기록이 없는 저장본도 충돌 확인이 불가능하므로 전체 재계산
+        if stored.attrs.get("id_encoding") != ID_ENCODING or (raw_ids is not None and not ids_path.exists()):
+            stored, stats = None, None
+
+    if stored is not None and all(k in stored.columns for k in keys):
+        # 충돌한 ID는 저장된 키와 같아 보여 신규 행에서 빠지므로 키 비교 전에 확인
+        if raw_ids is not None:
+            check_id_collisions(raw_ids, ids_path)
+        is_new = ~pd.MultiIndex.from_frame(src_keys).isin(pd.MultiIndex.from_frame(stored[keys]))
+        n_new = int(is_new.sum())
+        if n_new == 0:
+            print("(증분)신규 행 없음:", stored.shape)
+            return stored.drop(columns="EXAMIN_YEAR", errors="ignore")
+        full = needs_refit(len(stored), n_new, columns=columns, refit_ratio=refit_ratio)
+    else:
+        is_new, n_new, full = np.ones(len(df_src), dtype=bool), len(df_src), True
+
+    if full:
+        df_delta, stats = df_src, {}
+    else:
+        df_delta = df_src[is_new]
+
+    df_feat = featuring_data(
+        preprocessing_data(df_delta, use_cache=False, columns=columns), stats=stats, use_cache=False, columns=columns
+    )
+    if "EXAMIN_YEAR" in keys:
+        df_feat.insert(1, "EXAMIN_YEAR", src_keys.loc[df_feat.index, "EXAMIN_YEAR"].to_numpy())
+
+    if full:
+        df_all = df_feat.reset_index(drop=True)
+    else:
+        df_all = pd.concat([stored, df_feat], ignore_index=True)
+        # 범주 목록이 다른 category 컬럼은 concat 시 object가 되므로 다시 category로
+        for col in df_feat.columns:
+            if isinstance(df_feat[col].dtype, pd.CategoricalDtype) and df_all[col].dtype == object:
+                df_all[col] = df_all[col].astype("category")
+
+    df_all.attrs["id_encoding"] = ID_ENCODING
+    if raw_ids is not None:
+        if full:
+            ids_path.unlink(missing_ok=True)
+        save_id_dict(raw_ids if full else raw_ids[is_new], ids_path)
+    df_all.to_parquet(store_path)
+    with open(stats_path, "w", encoding="utf-8") as f:
+        json.dump(stats, f, ensure_ascii=False, indent=2)
+
+    print("(증분)신규", n_new, "행", "| 전체 재계산" if full else "| 저장된 통계 재사용", "→", df_all.shape)
+    return df_all.drop(columns="EXAMIN_YEAR", errors="ignore")
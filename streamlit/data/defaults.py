@@ -1,9 +1,16 @@
+import sys
 import pandas as pd
 from pathlib import Path
 data_dir = Path(__file__).resolve().parent
 
-data_path = data_dir / "results/model_pred_result_analysis.csv"
-df = pd.read_csv(data_path)
+# 결과 파일 로더 (Parquet 우선, 없으면 CSV)
+model_dir = str(data_dir.parents[1] / "smoke_churn_model")
+if model_dir not in sys.path:
+    sys.path.append(model_dir)
+from modules.artifacts import load_table
+
+data_path = data_dir / "results/model_pred_result_analysis.parquet"
+df = load_table(data_path)
 print(df.columns)
 
 # 금연 성공자 평균
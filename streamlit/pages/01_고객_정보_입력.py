@@ -1,6 +1,14 @@
 # pages/01_환자_정보_입력.py
+import sys
 import datetime as dt
 import streamlit as st
+from pathlib import Path
+
+# 학습 파이프라인과 같은 인코딩 사용 (smoke_churn_model/modules)
+model_dir = str(Path(__file__).resolve().parents[2] / "smoke_churn_model")
+if model_dir not in sys.path:
+    sys.path.append(model_dir)
+from modules.features_pdy import pack_weight_control, ACTIVITY_LABELS
 
 st.set_page_config(page_title="환자 정보 입력", layout="wide")
 
@@ -21,8 +29,13 @@ MAP = {
     "아침식사빈도": {
         "주 5~7회": 1, "주 3~4회": 2, "주 1~2회": 3, "거의 안 함": 4
     },
+    # 체중조절방법 코드 → features_pdy.feature_weight_control_method
+    # pack_weight_control(운동 obb_02a1, 단식 obb_02b1, 무처방약물 obb_02d1) / 1=예, 2=아니오
+    # 설문에 식이조절 단독 문항은 없음 → 단식 문항을 그대로 "단식"으로 표시
     "weight_control_method": {
-        "없음": 0, "운동": 1, "식이": 2, "운동+식이": 3, "약물/기타": 4
+        "없음": pack_weight_control(2, 2, 2), "운동": pack_weight_control(1, 2, 2),
+        "단식": pack_weight_control(2, 1, 2), "운동+단식": pack_weight_control(1, 1, 2),
+        "약물/기타": pack_weight_control(2, 2, 1)
     },
     "화장실각성여부": {"아니오": 1, "예": 3},
     "평생 음주 여부": {"아니오": 2, "예": 1},
@@ -40,21 +53,6 @@ MAP = {
     # "아침식사여부": {"아니오": 0, "예": 1},
 }
 
-# MAP = {
-#     "성별": {"남자": 1, "여자": 0},
-#     "marital_stability": {"미혼": 0, "기혼-안정": 1, "기혼-불안": 2, "이혼/별거": 3, "사별": 4},
-#     "아침식사빈도": {"거의 안 함": 0, "주 1-2회": 1, "주 3-4회": 2, "주 5-6회": 3, "매일": 4},
-#     "weight_control_method": {"없음": 0, "운동": 1, "식이": 2, "운동+식이": 3, "약물/기타": 4},
-#     "화장실각성여부": {"아니오": 0, "예": 1},
-#     "평생 음주 여부": {"아니오": 0, "예": 1},
-#     "연간 음주 빈도": {"안 함": 0, "월 1회 미만": 1, "월 1-3회": 2, "주 1-2회": 3, "주 3-4회": 4, "거의 매일": 5},
-#     "가정내흡연자존재": {"아니오": 0, "예": 1},
-#     "치매검사여부": {"아니오": 0, "예": 1},
-#     "occupation_type": {"무직": 0, "학생": 1, "자영업": 2, "사무직": 3, "생산/서비스": 4, "전문직": 5, "기타": 6},
-#     "최근 1주일 유연성 운동 실천": {"안 함": 0, "1-2일": 1, "3-4일": 2, "5일 이상": 3},
-#     "구강건강자기평가": {"매우 나쁨": 1, "나쁨": 2, "보통": 3, "좋음": 4, "매우 좋음": 5}
-#     # "아침식사여부": {"아니오": 0, "예": 1},
-# }
 def enc(cat, val): return MAP[cat][val]
 
 ctprvn_dict = {
@@ -93,7 +91,8 @@ with st.expander("필수 입력 항목", expanded=True):
         is_economically_active = st.selectbox("경제활동 여부", options=["경제활동 중", "비경제활동"])
         is_economically_active_code = {"경제활동 중": 1, "비경제활동": 0}[is_economically_active]
         activity_display = st.selectbox("신체활동 수준을 선택하세요", options=["활동량이 많음", "보통", "적음", "없음"])
-        activity_score = {"활동량이 많음": "high_activity", "보통": "normal_activity", "적음": "low_activity", "없음": "no_activity"}[activity_display]
+        # 학습 데이터의 activity_score 라벨 (features_pdy.ACTIVITY_LABELS: 없음 → 많음 순)
+        activity_score = dict(zip(["없음", "적음", "보통", "활동량이 많음"], ACTIVITY_LABELS))[activity_display]
         oral_raw = st.selectbox("구강건강 자기평가", list(MAP["구강건강자기평가"].keys()), index=3, key="oral_raw")
 
     with c3:
@@ -328,25 +327,6 @@ if st.session_state.get("_should_switch_page"):
 #                 st.session_state[key] = dt.date.today()
 # _normalize_date_key("date")
 
-# # ---------- 매핑/인코딩 ----------
-# MAP = {
-#     "성별": {"남자": 1, "여자": 0},
-#     "marital_stability": {"미혼": 0, "기혼-안정": 1, "기혼-불안": 2, "이혼/별거": 3, "사별": 4},
-#     "아침식사빈도": {"거의 안 함": 0, "주 1-2회": 1, "주 3-4회": 2, "주 5-6회": 3, "매일": 4},
-#     "weight_control_method": {"없음": 0, "운동": 1, "식이": 2, "운동+식이": 3, "약물/기타": 4},
-#     "화장실각성여부": {"아니오": 0, "예": 1},
-#     "평생 음주 여부": {"아니오": 0, "예": 1},
-#     "연간 음주 빈도": {"안 함": 0, "월 1회 미만": 1, "월 1-3회": 2, "주 1-2회": 3, "주 3-4회": 4, "거의 매일": 5},
-#     "가정내흡연자존재": {"아니오": 0, "예": 1},
-#     "치매검사여부": {"아니오": 0, "예": 1},
-#     "occupation_type": {"무직": 0, "학생": 1, "자영업": 2, "사무직": 3, "생산/서비스": 4, "전문직": 5, "기타": 6},
-#     "최근 1주일 유연성 운동 실천": {"안 함": 0, "1-2일": 1, "3-4일": 2, "5일 이상": 3},
-#     "구강건강자기평가": {"매우 나쁨": 1, "나쁨": 2, "보통": 3, "좋음": 4, "매우 좋음": 5},
-#     "아침식사여부": {"아니오": 0, "예": 1},
-# }
-# def enc(cat_name: str, value: str) -> int:
-#     return MAP[cat_name][value]
-
 # st.title("환자 정보 입력")
 
 # # ---------- 입력 폼 ----------